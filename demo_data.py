@@ -7,13 +7,20 @@ Generates realistic manufacturing data for all 16 modules with proper production
 import streamlit as st
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta, date
-import uuid
-import random
-import hashlib
+import pyarrow as pa
+from pyarrow import csv as pacsv
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+import xlsxwriter
+from datetime import date
 import json
-from typing import Dict, List, Optional
+import hashlib
+import threading
+from functools import lru_cache
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 import os
+from types import MappingProxyType
+from typing import List, Optional
 from io import BytesIO
 
 # Set page config
@@ -25,11 +32,44 @@ st.set_page_config(
 
 # Set random seed for reproducibility
 RANDOM_SEED = 42
-np.random.seed(RANDOM_SEED)
-random.seed(RANDOM_SEED)
+
+class _ThreadRNG(threading.local):
+    """Module-wide Generator, replaceable per thread so parallel generators keep their own stream"""
+    generator = np.random.default_rng(RANDOM_SEED)
+    
+    def __getattr__(self, name):
+        return getattr(self.generator, name)
+
+RNG = _ThreadRNG()
+
+# Shift start/end as minutes after midnight; patterns not listed here work the morning shift
+SHIFT_MINUTES = MappingProxyType({
+    "Morning": (8 * 60, 17 * 60),
+    "Evening": (14 * 60, 23 * 60)
+})
+
+# Mid-month snapshot dates for inventory analytics
+ANALYSIS_DATES = tuple(date(2024, month, 15) for month in range(1, 13))
+
+# Actions a user can take in each module of the audit trail
+ACTIONS_BY_MODULE = MappingProxyType({
+    'Production': ('CREATE_BATCH', 'UPDATE_FORMULATION', 'VIEW_REPORT', 'APPROVE_QC'),
+    'Inventory': ('ADD_STOCK', 'ISSUE_STOCK', 'TRANSFER', 'ADJUST'),
+    'Sales': ('CREATE_ORDER', 'PROCESS_PAYMENT', 'ISSUE_INVOICE', 'VIEW_CUSTOMER'),
+    'Finance': ('POST_TRANSACTION', 'GENERATE_REPORT', 'APPROVE_PAYMENT', 'RECONCILE'),
+    'HR': ('ADD_EMPLOYEE', 'UPDATE_SALARY', 'APPROVE_LEAVE', 'GENERATE_PAYROLL'),
+    'System': ('LOGIN', 'LOGOUT', 'CHANGE_SETTING', 'VIEW_AUDIT')
+})
+
+# Text columns are held in Arrow memory (no per-value Python objects)
+STRING_DTYPE = pd.StringDtype("pyarrow")
+
+def _freeze(mapping: dict) -> MappingProxyType:
+    """Wrap a nested dict in read-only views, level by level"""
+    return MappingProxyType({k: _freeze(v) if isinstance(v, dict) else v for k, v in mapping.items()})
 
 # ==================== DATA SCHEMAS ====================
-SCHEMAS = {
+SCHEMAS = _freeze({
     # ========== PRODUCTION MODULE ==========
     "dim_formulations": {
         "required": {
@@ -320,10 +360,134 @@ SCHEMAS = {
             "details": "str"
         }
     }
-}
+})
+
+# Storage dtype per schema type; date/datetime/time columns keep their Python values
+_DTYPE_MAP = MappingProxyType({
+    "str": STRING_DTYPE,
+    "int": "int64",
+    "float": "float64",
+    "bool": "bool"
+})
+
+# Text columns with a handful of distinct values, stored as category (small int codes + one dictionary)
+LOW_CARD_COLS = MappingProxyType({
+    "dim_formulations": frozenset({"product_category", "status", "quality_standards"}),
+    "fact_production_batches": frozenset({"status", "equipment_id"}),
+    "dim_raw_materials": frozenset({"category", "unit_of_measure", "storage_requirements"}),
+    "fact_inventory_transactions": frozenset({"transaction_type", "location_id"}),
+    "dim_inventory_items": frozenset({"category", "unit_of_measure", "storage_location"}),
+    "fact_sales_transactions": frozenset({"payment_method", "payment_status", "sales_channel"}),
+    "dim_customers": frozenset({"customer_type", "city", "country"}),
+    "dim_employees": frozenset({"department", "employment_type", "shift_pattern"}),
+    "fact_attendance": frozenset({"attendance_status", "remarks"}),
+    "fact_financial_transactions": frozenset({"transaction_type", "payment_method", "status"}),
+    "dim_accounts": frozenset({"account_type", "category", "normal_balance"}),
+    "fact_ecommerce_orders": frozenset({"payment_status", "order_status", "shipping_method"}),
+    "fact_website_traffic": frozenset({"page_url", "referrer", "device_type", "location"}),
+    "fact_production_analytics": frozenset({"equipment_id"}),
+    "fact_inventory_analytics": frozenset({"category", "abc_classification"}),
+    "dim_tenants": frozenset({"business_type", "subscription_plan", "status"}),
+    "fact_audit_logs": frozenset({"tenant_id", "module", "action", "resource"})
+})
+
+# Required column names and (column, type) pairs per table, derived once from the frozen schema
+_REQUIRED_SETS = MappingProxyType({name: frozenset(schema["required"]) for name, schema in SCHEMAS.items()})
+_REQUIRED_ITEMS = MappingProxyType({name: tuple(schema["required"].items()) for name, schema in SCHEMAS.items()})
+
+# Table names for the upload selector and the expected-columns listing shown for each table
+_SCHEMA_NAMES = tuple(SCHEMAS)
+_SCHEMA_COLUMN_TEXT = MappingProxyType({name: "\n".join(schema["required"]) for name, schema in SCHEMAS.items()})
+
+# Arrow parse type per schema type; time columns are kept as text, as validate_table stores them
+_ARROW_TYPES = MappingProxyType({
+    "str": pa.string(),
+    "int": pa.int64(),
+    "float": pa.float64(),
+    "bool": pa.bool_(),
+    "date": pa.date32(),
+    "datetime": pa.timestamp("ns"),
+    "time": pa.string()
+})
+_ARROW_COLUMN_TYPES = MappingProxyType({
+    name: MappingProxyType({col: _ARROW_TYPES[expected_type] for col, expected_type in items})
+    for name, items in _REQUIRED_ITEMS.items()
+})
+
+# Arrow strings come back Arrow-backed instead of as Python objects
+_PANDAS_TYPES = {pa.string(): STRING_DTYPE, pa.large_string(): STRING_DTYPE}.get
 
 # ==================== DATA GENERATION FUNCTIONS ====================
 
+def _choice(seq, n: int) -> np.ndarray:
+    """Draw n items from seq (with replacement) in a single RNG call"""
+    return RNG.choice(seq, size=n)
+
+def _random_dates(n: int, first_year: int, last_year: Optional[int] = None) -> np.ndarray:
+    """Draw n dates (day 1-28) between first_year and last_year as one vectorized build"""
+    years = RNG.integers(first_year, (last_year or first_year) + 1, n)
+    months = RNG.integers(1, 13, n)
+    days = RNG.integers(1, 29, n)
+    return pd.to_datetime({"year": years, "month": months, "day": days}).dt.date.to_numpy()
+
+def _arrow_table(cols) -> pa.Table:
+    """Lay out a column dict (scalars broadcast) or a list of row dicts as an Arrow table"""
+    if isinstance(cols, list):
+        return pa.Table.from_pylist(cols)
+    n = max(len(v) for v in cols.values() if np.ndim(v))
+    return pa.table({col: v if np.ndim(v) else [v] * n for col, v in cols.items()})
+
+def _build_df(table_name: str, *chunks) -> pd.DataFrame:
+    """Assemble a table from one or more column chunks in Arrow, then cast each column to its schema dtype"""
+    tables = [t for t in map(_arrow_table, chunks) if t.num_rows]
+    if not tables:
+        # Every chunk came out empty; still return the schema's columns
+        tables = [pa.schema(list(_ARROW_COLUMN_TYPES[table_name].items())).empty_table()]
+    # Later chunks follow the first one's column types (e.g. an int 0 column in a float column)
+    table = pa.concat_tables([t.cast(tables[0].schema) for t in tables])
+    df = table.to_pandas(types_mapper=_PANDAS_TYPES)
+    low_card = LOW_CARD_COLS.get(table_name, frozenset())
+    for col, expected_type in SCHEMAS[table_name]["required"].items():
+        if col in df.columns and expected_type in _DTYPE_MAP:
+            df[col] = df[col].astype("category" if col in low_card else _DTYPE_MAP[expected_type])
+    return df
+
+def _random_timestamps(n: int, year: int, first_hour: int, last_hour: int) -> np.ndarray:
+    """Draw n minute-resolution timestamps in year (day 1-28, hours first_hour-last_hour) as one vectorized build"""
+    months = RNG.integers(1, 13, n)
+    days = RNG.integers(1, 29, n)
+    hours = RNG.integers(first_hour, last_hour + 1, n)
+    minutes = RNG.integers(0, 60, n)
+    return pd.to_datetime({"year": np.full(n, year), "month": months, "day": days,
+                           "hour": hours, "minute": minutes}).to_numpy()
+
+def _minutes_to_times(minutes: np.ndarray) -> np.ndarray:
+    """Turn minutes after midnight into datetime.time values in one vectorized pass"""
+    return pd.to_datetime(minutes, unit="m").time
+
+def _interleave(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    """Alternate two equal-length arrays: first[0], second[0], first[1], second[1], ..."""
+    return np.column_stack([first, second]).ravel()
+
+def _format_ids(prefix: str, numbers, width: int = 0) -> np.ndarray:
+    """Build prefix + zero-padded number id strings for a whole integer array in one vectorized pass"""
+    digits = np.asarray(numbers).astype(str)
+    # np.char.zfill reduces over the array to size its output, which fails on an empty one
+    if digits.size:
+        digits = np.char.zfill(digits, width)
+    return np.char.add(prefix, digits)
+
+def _random_phones(n: int) -> List[str]:
+    """Draw n Kenyan mobile numbers in one batch"""
+    prefixes = _format_ids("+254 7", RNG.integers(10, 100, n))
+    numbers = _format_ids(" ", RNG.integers(100000, 1000000, n))
+    return np.char.add(prefixes, numbers).tolist()
+
+def _join_emails(first_arr: np.ndarray, last_arr: np.ndarray, domain: str) -> List[str]:
+    """Build first.last@domain addresses for whole name arrays at once"""
+    local = np.char.add(np.char.add(np.char.lower(first_arr), "."), np.char.lower(last_arr))
+    return np.char.add(local, f"@{domain}").tolist()
+
 def generate_tenants_data():
     """Generate tenant data for Cinta Beauty and demo tenants"""
     tenants = [
@@ -373,11 +537,10 @@ def generate_tenants_data():
             "contact_phone": "+254 722 456 789"
         }
     ]
-    return pd.DataFrame(tenants)
+    return _build_df("dim_tenants", tenants)
 
 def generate_formulations_data():
     """Generate Cinta Beauty product formulations"""
-    formulations = []
     product_categories = {
         "Skincare": ["Vitamin C Serum", "Hyaluronic Acid Serum", "Retinol Night Cream", "SPF 50 Sunscreen", 
                     "Tea Tree Face Wash", "Niacinamide Toner", "Ceramide Moisturizer", "AHA/BHA Exfoliant"],
@@ -388,28 +551,28 @@ def generate_formulations_data():
         "Makeup": ["Foundation", "Concealer", "Lipstick", "Mascara", "Blush", "Highlighter", "Eyeshadow", "Setting Spray"]
     }
     
-    formulation_id = 1
-    for category, products in product_categories.items():
-        for product in products:
-            formulations.append({
-                "formulation_id": f"FMT-{formulation_id:04d}",
-                "product_name": product,
-                "product_category": category,
-                "version": f"v{random.randint(1, 3)}.{random.randint(0, 9)}",
-                "status": random.choice(["Active", "Active", "Active", "Archived"]),
-                "created_date": date(2023, random.randint(1, 12), random.randint(1, 28)),
-                "expected_yield_percentage": round(random.uniform(85, 98), 2),
-                "production_cost_per_unit": round(random.uniform(150, 5000), 2),
-                "target_cycle_time_hours": round(random.uniform(2, 48), 1),
-                "quality_standards": random.choice(["KEBS", "FDA", "ISO 22716", "EU Regulations"])
-            })
-            formulation_id += 1
-    
-    return pd.DataFrame(formulations)
+    category_arr = np.repeat(list(product_categories.keys()), [len(products) for products in product_categories.values()])
+    product_arr = [product for products in product_categories.values() for product in products]
+    n = len(product_arr)
+    
+    major = RNG.integers(1, 4, n)
+    minor = RNG.integers(0, 10, n)
+    
+    return _build_df("dim_formulations", {
+        "formulation_id": _format_ids("FMT-", np.arange(1, n + 1), 4),
+        "product_name": product_arr,
+        "product_category": category_arr,
+        "version": np.char.add(_format_ids("v", major), _format_ids(".", minor)),
+        "status": _choice(["Active", "Active", "Active", "Archived"], n),
+        "created_date": _random_dates(n, 2023),
+        "expected_yield_percentage": RNG.uniform(85, 98, n).round(2),
+        "production_cost_per_unit": RNG.uniform(150, 5000, n).round(2),
+        "target_cycle_time_hours": RNG.uniform(2, 48, n).round(1),
+        "quality_standards": _choice(["KEBS", "FDA", "ISO 22716", "EU Regulations"], n)
+    })
 
 def generate_raw_materials_data():
     """Generate raw materials for cosmetic manufacturing"""
-    materials = []
     categories = {
         "Active Ingredients": ["Vitamin C (Ascorbic Acid)", "Hyaluronic Acid", "Retinol", "Niacinamide", 
                               "Salicylic Acid", "Glycolic Acid", "Ceramides", "Peptides", "Coenzyme Q10"],
@@ -424,31 +587,25 @@ def generate_raw_materials_data():
                      "Jar 60ml", "Spray Bottle", "Box Packaging", "Labels"]
     }
     
-    suppliers = [f"SUP-{i:03d}" for i in range(1, 21)]
-    
-    material_id = 1
-    for category, items in categories.items():
-        for item in items:
-            unit_cost = random.uniform(50, 5000)
-            materials.append({
-                "material_id": f"MAT-{material_id:04d}",
-                "material_name": item,
-                "category": category,
-                "supplier_id": random.choice(suppliers),
-                "unit_of_measure": random.choice(["kg", "liters", "pieces", "grams"]),
-                "unit_cost": round(unit_cost, 2),
-                "min_stock_level": random.randint(10, 100),
-                "current_stock": random.randint(50, 500),
-                "shelf_life_days": random.choice([180, 365, 730, 1095]),
-                "storage_requirements": random.choice(["Room Temp", "Cool Dry Place", "Refrigerated", "Air Tight"])
-            })
-            material_id += 1
-    
-    return pd.DataFrame(materials)
+    category_arr = np.repeat(list(categories.keys()), [len(items) for items in categories.values()])
+    name_arr = [item for items in categories.values() for item in items]
+    n = len(name_arr)
+    
+    return _build_df("dim_raw_materials", {
+        "material_id": _format_ids("MAT-", np.arange(1, n + 1), 4),
+        "material_name": name_arr,
+        "category": category_arr,
+        "supplier_id": _format_ids("SUP-", RNG.integers(1, 21, n), 3),
+        "unit_of_measure": _choice(["kg", "liters", "pieces", "grams"], n),
+        "unit_cost": RNG.uniform(50, 5000, n).round(2),
+        "min_stock_level": RNG.integers(10, 101, n),
+        "current_stock": RNG.integers(50, 501, n),
+        "shelf_life_days": _choice([180, 365, 730, 1095], n),
+        "storage_requirements": _choice(["Room Temp", "Cool Dry Place", "Refrigerated", "Air Tight"], n)
+    })
 
 def generate_employees_data():
     """Generate employee data for manufacturing company"""
-    employees = []
     departments = {
         "Production": ["Production Manager", "Line Supervisor", "Machine Operator", "Quality Technician", 
                       "Production Worker", "Maintenance Technician"],
@@ -468,44 +625,49 @@ def generate_employees_data():
                   "Moore", "Taylor", "Anderson", "Thomas", "Jackson", "White", "Harris", "Martin",
                   "Thompson", "Garcia", "Martinez", "Robinson", "Clark", "Rodriguez", "Lewis", "Lee"]
     
-    employee_id = 1
-    for dept, positions in departments.items():
-        for position in positions:
-            first_name = random.choice(first_names)
-            last_name = random.choice(last_names)
-            email = f"{first_name.lower()}.{last_name.lower()}@cintabeauty.co.ke"
-            hire_date = date(2020 + random.randint(0, 4), random.randint(1, 12), random.randint(1, 28))
-            
-            # Salary ranges by position
-            if "Manager" in position:
-                salary = random.uniform(150000, 300000)
-            elif "Senior" in position or "Lead" in position:
-                salary = random.uniform(80000, 150000)
-            else:
-                salary = random.uniform(30000, 80000)
-            
-            employees.append({
-                "employee_id": f"EMP-{employee_id:04d}",
-                "first_name": first_name,
-                "last_name": last_name,
-                "email": email,
-                "phone": f"+254 7{random.randint(10, 99)} {random.randint(100000, 999999)}",
-                "department": dept,
-                "position": position,
-                "hire_date": hire_date,
-                "salary": round(salary, 2),
-                "employment_type": random.choice(["Permanent", "Contract", "Temporary"]),
-                "supervisor_id": f"EMP-{random.randint(1, 5):04d}" if employee_id > 5 else "",
-                "shift_pattern": random.choice(["Morning", "Evening", "Night", "Flexible"]),
-                "active": random.choice([True, True, True, False])
-            })
-            employee_id += 1
-    
-    return pd.DataFrame(employees)
+    dept_arr = np.repeat(list(departments.keys()), [len(positions) for positions in departments.values()])
+    position_arr = np.array([position for positions in departments.values() for position in positions])
+    n = len(position_arr)
+    
+    first_arr = _choice(first_names, n)
+    last_arr = _choice(last_names, n)
+    emails = _join_emails(first_arr, last_arr, "cintabeauty.co.ke")
+    phones = _random_phones(n)
+    hire_dates = _random_dates(n, 2020, 2024)
+    salary_draws = RNG.random(n)
+    employment_types = _choice(["Permanent", "Contract", "Temporary"], n)
+    # The first five employees report to nobody; the rest to one of them
+    supervisor_pool = np.array(_format_ids("EMP-", np.arange(1, 6), 4), dtype=object)
+    supervisor_ids = _choice(supervisor_pool, n)
+    supervisor_ids[:5] = ""
+    shift_patterns = _choice(["Morning", "Evening", "Night", "Flexible"], n)
+    active_flags = _choice([True, True, True, False], n)
+    
+    # Salary ranges by position
+    is_manager = np.char.find(position_arr, "Manager") >= 0
+    is_senior = (np.char.find(position_arr, "Senior") >= 0) | (np.char.find(position_arr, "Lead") >= 0)
+    low = np.select([is_manager, is_senior], [150000, 80000], 30000)
+    high = np.select([is_manager, is_senior], [300000, 150000], 80000)
+    salary = low + salary_draws * (high - low)
+    
+    return _build_df("dim_employees", {
+        "employee_id": _format_ids("EMP-", np.arange(1, n + 1), 4),
+        "first_name": first_arr,
+        "last_name": last_arr,
+        "email": emails,
+        "phone": phones,
+        "department": dept_arr,
+        "position": position_arr,
+        "hire_date": hire_dates,
+        "salary": salary.round(2),
+        "employment_type": employment_types,
+        "supervisor_id": supervisor_ids,
+        "shift_pattern": shift_patterns,
+        "active": active_flags
+    })
 
 def generate_customers_data():
     """Generate customer data for B2B and B2C"""
-    customers = []
     cities = ["Nairobi", "Mombasa", "Kisumu", "Nakuru", "Eldoret", "Thika", "Malindi", "Kitale"]
     
     # B2B Customers (Retailers, Distributors)
@@ -518,374 +680,378 @@ def generate_customers_data():
                    "Ruth", "Esther", "Naomi", "Hannah", "David", "Isaac", "Jacob", "Daniel", "Stephen", "Andrew"]
     last_names = ["Mwangi", "Kariuki", "Ochieng", "Odhiambo", "Kamau", "Wanjiru", "Akinyi", "Achieng", "Otieno", "Omondi"]
     
-    customer_id = 1
-    
-    # B2B Customers
-    for name in b2b_names:
-        city = random.choice(cities)
-        customers.append({
-            "customer_id": f"B2B-{customer_id:04d}",
-            "customer_name": name,
-            "customer_type": "Business",
-            "email": f"orders@{name.lower().replace(' ', '')}.co.ke",
-            "phone": f"+254 7{random.randint(10, 99)} {random.randint(100000, 999999)}",
-            "address": f"{random.randint(1, 999)} {random.choice(['Moi', 'Kenyatta', 'Uhuru', 'Koinange'])} Avenue",
-            "city": city,
-            "country": "Kenya",
-            "customer_since": date(2020 + random.randint(0, 4), random.randint(1, 12), random.randint(1, 28)),
-            "loyalty_points": random.randint(1000, 10000),
-            "total_purchases": round(random.uniform(50000, 500000), 2),
-            "last_purchase_date": date(2024, random.randint(1, 12), random.randint(1, 28))
-        })
-        customer_id += 1
-    
-    # B2C Customers
-    for i in range(50):
-        first = random.choice(first_names)
-        last = random.choice(last_names)
-        city = random.choice(cities)
-        customers.append({
-            "customer_id": f"B2C-{customer_id:04d}",
-            "customer_name": f"{first} {last}",
-            "customer_type": "Individual",
-            "email": f"{first.lower()}.{last.lower()}@gmail.com",
-            "phone": f"+254 7{random.randint(10, 99)} {random.randint(100000, 999999)}",
-            "address": f"{random.randint(1, 999)} {random.choice(['Street', 'Road', 'Avenue', 'Drive'])}",
-            "city": city,
-            "country": "Kenya",
-            "customer_since": date(2022 + random.randint(0, 2), random.randint(1, 12), random.randint(1, 28)),
-            "loyalty_points": random.randint(0, 500),
-            "total_purchases": round(random.uniform(1000, 50000), 2),
-            "last_purchase_date": date(2024, random.randint(1, 12), random.randint(1, 28))
-        })
-        customer_id += 1
-    
-    return pd.DataFrame(customers)
+    n_b2b = len(b2b_names)
+    n_b2c = 50
+    
+    # Contact details for each segment are drawn in one batch
+    b2b_emails = np.char.add(np.char.add("orders@", np.char.replace(np.char.lower(b2b_names), " ", "")), ".co.ke").tolist()
+    b2b_phones = _random_phones(n_b2b)
+    b2b_numbers = _format_ids("", RNG.integers(1, 1000, n_b2b))
+    b2b_streets = _choice(['Moi', 'Kenyatta', 'Uhuru', 'Koinange'], n_b2b)
+    b2b_addresses = np.char.add(np.char.add(b2b_numbers, " "), np.char.add(b2b_streets, " Avenue")).tolist()
+    
+    b2c_first = _choice(first_names, n_b2c)
+    b2c_last = _choice(last_names, n_b2c)
+    b2c_names = np.char.add(np.char.add(b2c_first, " "), b2c_last).tolist()
+    b2c_emails = _join_emails(b2c_first, b2c_last, "gmail.com")
+    b2c_phones = _random_phones(n_b2c)
+    b2c_numbers = _format_ids("", RNG.integers(1, 1000, n_b2c))
+    b2c_streets = _choice(['Street', 'Road', 'Avenue', 'Drive'], n_b2c)
+    b2c_addresses = np.char.add(np.char.add(b2c_numbers, " "), b2c_streets).tolist()
+    
+    n = n_b2b + n_b2c
+    city_arr = _choice(cities, n)
+    last_purchase_dates = _random_dates(n, 2024)
+    b2b_since = _random_dates(n_b2b, 2020, 2024)
+    b2b_points = RNG.integers(1000, 10001, n_b2b)
+    b2b_purchases = RNG.uniform(50000, 500000, n_b2b).round(2)
+    b2c_since = _random_dates(n_b2c, 2022, 2024)
+    b2c_points = RNG.integers(0, 501, n_b2c)
+    b2c_purchases = RNG.uniform(1000, 50000, n_b2c).round(2)
+    
+    # B2B customers first, then B2C, numbered in one sequence
+    return _build_df("dim_customers", {
+        "customer_id": np.concatenate([_format_ids("B2B-", np.arange(1, n_b2b + 1), 4), _format_ids("B2C-", np.arange(n_b2b + 1, n + 1), 4)]),
+        "customer_name": b2b_names + b2c_names,
+        "customer_type": ["Business"] * n_b2b + ["Individual"] * n_b2c,
+        "email": b2b_emails + b2c_emails,
+        "phone": b2b_phones + b2c_phones,
+        "address": b2b_addresses + b2c_addresses,
+        "city": city_arr,
+        "country": "Kenya",
+        "customer_since": np.concatenate([b2b_since, b2c_since]),
+        "loyalty_points": np.concatenate([b2b_points, b2c_points]),
+        "total_purchases": np.concatenate([b2b_purchases, b2c_purchases]),
+        "last_purchase_date": last_purchase_dates
+    })
 
-def generate_production_batches(formulations_df, employees_df):
-    """Generate production batch data with manufacturing flow"""
-    batches = []
+def _compute_batch_metrics(planned_qty, yield_arr, cost_arr, cycle_arr, qty_noise, cost_noise, quality_noise, cycle_noise):
+    """Derive per-batch quantity, yield, cost, quality and cycle time from pre-drawn multipliers"""
+    actual_qty = (planned_qty * (yield_arr / 100) * qty_noise).astype(np.int64)
+    yield_pct = (actual_qty / planned_qty) * 100
     
-    formulations = formulations_df[formulations_df['status'] == 'Active'].to_dict('records')
-    production_staff = employees_df[employees_df['department'] == 'Production']['employee_id'].tolist()
+    # Production cost calculation
+    total_cost = actual_qty * cost_arr * cost_noise
     
-    batch_id = 1
-    for _ in range(100):  # Generate 100 batches
-        formulation = random.choice(formulations)
-        production_date = date(2024, random.randint(1, 12), random.randint(1, 28))
-        
-        planned_qty = random.randint(100, 1000)
-        actual_qty = int(planned_qty * (formulation['expected_yield_percentage'] / 100) * random.uniform(0.9, 1.1))
-        yield_pct = (actual_qty / planned_qty) * 100
-        
-        status = random.choice(['Completed', 'Completed', 'Completed', 'In Progress', 'Quality Hold'])
-        
-        # Production cost calculation
-        unit_cost = formulation['production_cost_per_unit']
-        total_cost = actual_qty * unit_cost * random.uniform(0.95, 1.05)
-        
-        # Quality score based on yield and variance
-        quality_score = min(100, yield_pct * random.uniform(0.8, 1.2))
-        
-        batches.append({
-            "batch_id": f"BATCH-{batch_id:04d}",
-            "formulation_id": formulation['formulation_id'],
-            "production_date": production_date,
-            "planned_quantity": planned_qty,
-            "actual_quantity": actual_qty,
-            "yield_percentage": round(yield_pct, 2),
-            "status": status,
-            "equipment_id": f"EQP-{random.randint(1, 10):03d}",
-            "supervisor_id": random.choice(production_staff),
-            "quality_score": round(quality_score, 1),
-            "total_cost": round(total_cost, 2),
-            "completion_time_hours": round(formulation['target_cycle_time_hours'] * random.uniform(0.8, 1.3), 1)
-        })
-        batch_id += 1
-    
-    return pd.DataFrame(batches)
+    # Quality score based on yield and variance
+    quality_score = np.minimum(100, yield_pct * quality_noise)
+    
+    cycle_time = cycle_arr * cycle_noise
+    return actual_qty, yield_pct, total_cost, quality_score, cycle_time
+
+def generate_production_batches(formulations_df, employees_df):
+    """Generate production batch data with manufacturing flow"""
+    active = formulations_df[formulations_df['status'] == 'Active']
+    fid_arr = active['formulation_id'].to_numpy()
+    yield_arr = active['expected_yield_percentage'].to_numpy(dtype=float)
+    cost_arr = active['production_cost_per_unit'].to_numpy(dtype=float)
+    cycle_arr = active['target_cycle_time_hours'].to_numpy(dtype=float)
+    production_staff = employees_df[employees_df['department'] == 'Production']['employee_id'].to_numpy()
+    
+    n_batches = 100  # Generate 100 batches
+    idx = RNG.integers(0, len(active), n_batches)
+    production_dates = _random_dates(n_batches, 2024)
+    
+    planned_qty = RNG.integers(100, 1001, n_batches)
+    qty_noise = RNG.uniform(0.9, 1.1, n_batches)
+    status = _choice(['Completed', 'Completed', 'Completed', 'In Progress', 'Quality Hold'], n_batches)
+    cost_noise = RNG.uniform(0.95, 1.05, n_batches)
+    quality_noise = RNG.uniform(0.8, 1.2, n_batches)
+    equipment_ids = _format_ids("EQP-", RNG.integers(1, 11, n_batches), 3)
+    supervisor_ids = _choice(production_staff, n_batches)
+    cycle_noise = RNG.uniform(0.8, 1.3, n_batches)
+    
+    actual_qty, yield_pct, total_cost, quality_score, cycle_time = _compute_batch_metrics(
+        planned_qty, yield_arr[idx], cost_arr[idx], cycle_arr[idx],
+        qty_noise, cost_noise, quality_noise, cycle_noise
+    )
+    
+    return _build_df("fact_production_batches", {
+        "batch_id": _format_ids("BATCH-", np.arange(1, n_batches + 1), 4),
+        "formulation_id": fid_arr[idx],
+        "production_date": production_dates,
+        "planned_quantity": planned_qty,
+        "actual_quantity": actual_qty,
+        "yield_percentage": yield_pct.round(2),
+        "status": status,
+        "equipment_id": equipment_ids,
+        "supervisor_id": supervisor_ids,
+        "quality_score": quality_score.round(1),
+        "total_cost": total_cost.round(2),
+        "completion_time_hours": cycle_time.round(1)
+    })
 
 def generate_inventory_items(batches_df, formulations_df):
     """Generate inventory items from production batches"""
-    inventory_items = []
-    
-    # Create a mapping from formulation_id to product_name
-    formulation_to_product = dict(zip(formulations_df['formulation_id'], formulations_df['product_name']))
-    formulation_to_category = dict(zip(formulations_df['formulation_id'], formulations_df['product_category']))
-    
-    # Create inventory items from formulations
-    for formulation_id, product_name in formulation_to_product.items():
-        category = formulation_to_category[formulation_id]
-        
-        # Generate SKU from product name
-        sku_base = ''.join([word[:3].upper() for word in product_name.split()])
-        sku = f"{sku_base}-{category[:3].upper()}-{random.randint(100, 999)}"
-        
-        # Get batches for this formulation
-        formulation_batches = batches_df[batches_df['formulation_id'] == formulation_id]
-        total_produced = formulation_batches['actual_quantity'].sum() if not formulation_batches.empty else 0
-        
-        # Get cost from formulations_df
-        formulation_row = formulations_df[formulations_df['formulation_id'] == formulation_id].iloc[0]
-        unit_cost = formulation_row['production_cost_per_unit']
-        
-        # Simulate sales to determine current stock
-        current_stock = int(total_produced * random.uniform(0.1, 0.7))
-        
-        inventory_items.append({
-            "sku": sku,
-            "item_name": product_name,
-            "category": category,
-            "unit_of_measure": random.choice(["pcs", "ml", "g", "jar"]),
-            "current_stock": current_stock,
-            "min_stock_level": random.randint(10, 100),
-            "max_stock_level": random.randint(500, 5000),
-            "average_unit_cost": unit_cost,
-            "total_value": round(current_stock * unit_cost, 2),
-            "last_restock_date": date(2024, random.randint(1, 12), random.randint(1, 28)),
-            "expiry_date": date(2025 + random.randint(0, 2), random.randint(1, 12), random.randint(1, 28)),
-            "storage_location": random.choice(["Warehouse A", "Warehouse B", "Cold Room", "Shelf Storage"])
-        })
-    
-    return pd.DataFrame(inventory_items)
+    fid_arr = formulations_df['formulation_id'].to_numpy()
+    product_arr = formulations_df['product_name'].tolist()
+    category_arr = formulations_df['product_category'].tolist()
+    cost_arr = formulations_df['production_cost_per_unit'].to_numpy(dtype=float)
+    
+    # Total produced per formulation in a single grouped pass over the batches
+    total_produced = batches_df.groupby('formulation_id')['actual_quantity'].sum().reindex(fid_arr, fill_value=0).to_numpy()
+    
+    n = len(fid_arr)
+    sku_suffixes = RNG.integers(100, 1000, n)
+    stock_ratios = RNG.uniform(0.1, 0.7, n)
+    units = _choice(["pcs", "ml", "g", "jar"], n)
+    min_levels = RNG.integers(10, 101, n)
+    max_levels = RNG.integers(500, 5001, n)
+    restock_dates = _random_dates(n, 2024)
+    expiry_dates = _random_dates(n, 2025, 2027)
+    locations = _choice(["Warehouse A", "Warehouse B", "Cold Room", "Shelf Storage"], n)
+    
+    # Generate SKU from product name: first three letters of each word, then the category prefix
+    products = formulations_df['product_name'].astype(STRING_DTYPE)
+    sku_base = products.str.replace(r"(\S{1,3})\S*\s*", r"\1", regex=True).str.upper()
+    category_prefix = formulations_df['product_category'].astype(STRING_DTYPE).str[:3].str.upper()
+    skus = (sku_base + "-" + category_prefix + "-" + pd.Series(sku_suffixes, index=products.index).astype(STRING_DTYPE)).to_numpy()
+    
+    # Simulate sales to determine current stock
+    current_stock = (total_produced * stock_ratios).astype(np.int64)
+    
+    return _build_df("dim_inventory_items", {
+        "sku": skus,
+        "item_name": product_arr,
+        "category": category_arr,
+        "unit_of_measure": units,
+        "current_stock": current_stock,
+        "min_stock_level": min_levels,
+        "max_stock_level": max_levels,
+        "average_unit_cost": cost_arr,
+        "total_value": (current_stock * cost_arr).round(2),
+        "last_restock_date": restock_dates,
+        "expiry_date": expiry_dates,
+        "storage_location": locations
+    })
 
 def generate_inventory_transactions(inventory_items_df, batches_df, employees_df, formulations_df):
     """Generate inventory transactions (receiving, issuing, transfers)"""
-    transactions = []
-    
     inventory_staff = employees_df[employees_df['department'].isin(['Supply Chain', 'Production'])]['employee_id'].tolist()
-    transaction_id = 1
-    
-    # Create a mapping from formulation_id to product_name
-    formulation_to_product = dict(zip(formulations_df['formulation_id'], formulations_df['product_name']))
     
-    # Production Receipts
-    for _, batch in batches_df.iterrows():
-        if batch['status'] == 'Completed':
-            # Find inventory item for this batch
-            formulation_id = batch['formulation_id']
-            product_name = formulation_to_product.get(formulation_id, "")
-            
-            if product_name:
-                # Find inventory item by product name
-                inventory_item = inventory_items_df[inventory_items_df['item_name'] == product_name]
-                
-                if not inventory_item.empty:
-                    sku = inventory_item.iloc[0]['sku']
-                    unit_cost = inventory_item.iloc[0]['average_unit_cost']
-                    
-                    transactions.append({
-                        "transaction_id": f"INV-{transaction_id:06d}",
-                        "transaction_date": batch['production_date'],
-                        "transaction_type": "Production Receipt",
-                        "sku": sku,
-                        "batch_id": batch['batch_id'],
-                        "quantity": batch['actual_quantity'],
-                        "unit_cost": unit_cost,
-                        "total_value": round(batch['actual_quantity'] * unit_cost, 2),
-                        "location_id": "WH01",
-                        "reference_document": f"PROD-{batch['batch_id']}",
-                        "employee_id": random.choice(inventory_staff)
-                    })
-                    transaction_id += 1
-    
-    # Sales Issues
-    for _, item in inventory_items_df.iterrows():
-        if item['current_stock'] > 0:
-            # Generate some sales transactions
-            sales_qty = random.randint(1, min(100, item['current_stock']))
-            for _ in range(random.randint(1, 5)):
-                transactions.append({
-                    "transaction_id": f"INV-{transaction_id:06d}",
-                    "transaction_date": date(2024, random.randint(1, 12), random.randint(1, 28)),
-                    "transaction_type": "Sales Issue",
-                    "sku": item['sku'],
-                    "batch_id": f"BATCH-{random.randint(1, 100):04d}",
-                    "quantity": -sales_qty,  # Negative for issues
-                    "unit_cost": item['average_unit_cost'],
-                    "total_value": round(-sales_qty * item['average_unit_cost'], 2),
-                    "location_id": "WH01",
-                    "reference_document": f"SALE-{random.randint(1000, 9999)}",
-                    "employee_id": random.choice(inventory_staff)
-                })
-                transaction_id += 1
+    # Lookup tables keyed by formulation and by product name, joined onto the batches in one pass
+    product_lookup = formulations_df.set_index('formulation_id')['product_name']
+    item_lookup = inventory_items_df.set_index('item_name')[['sku', 'average_unit_cost']]
+    
+    # Production Receipts: completed batches whose product has an inventory item
+    receipt_staff = _choice(inventory_staff, len(batches_df))
+    received = (batches_df.assign(employee_id=receipt_staff)
+                .join(product_lookup, on='formulation_id')
+                .join(item_lookup, on='product_name'))
+    received = received[(received['status'] == 'Completed') & received['sku'].notna()]
+    n_receipts = len(received)
+    receipt_qtys = received['actual_quantity'].to_numpy()
+    receipt_costs = received['average_unit_cost'].to_numpy(dtype=float)
+    receipts = {
+        "transaction_id": _format_ids("INV-", np.arange(1, n_receipts + 1), 6),
+        "transaction_date": received['production_date'].to_numpy(),
+        "transaction_type": "Production Receipt",
+        "sku": received['sku'].to_numpy(),
+        "batch_id": received['batch_id'].to_numpy(),
+        "quantity": receipt_qtys,
+        "unit_cost": receipt_costs,
+        "total_value": (receipt_qtys * receipt_costs).round(2),
+        "location_id": "WH01",
+        "reference_document": ("PROD-" + received['batch_id']).to_numpy(),
+        "employee_id": received['employee_id'].to_numpy()
+    }
+    transaction_id = n_receipts + 1
+    
+    # Sales Issues: 1-5 issues per SKU in stock, each with its own quantity, built as one chunk
+    skus = inventory_items_df['sku'].to_numpy()
+    stocks = inventory_items_df['current_stock'].to_numpy()
+    costs = inventory_items_df['average_unit_cost'].to_numpy(dtype=float)
+    issue_counts = np.where(stocks > 0, RNG.integers(1, 6, len(stocks)), 0)
+    n_issues = int(issue_counts.sum())
+    issue_qtys = RNG.integers(1, np.repeat(np.minimum(100, stocks), issue_counts) + 1)
+    issue_costs = np.repeat(costs, issue_counts)
+    issues = {
+        "transaction_id": _format_ids("INV-", np.arange(transaction_id, transaction_id + n_issues), 6),
+        "transaction_date": _random_dates(n_issues, 2024),
+        "transaction_type": "Sales Issue",
+        "sku": np.repeat(skus, issue_counts),
+        "batch_id": _format_ids("BATCH-", RNG.integers(1, 101, n_issues), 4),
+        "quantity": -issue_qtys,  # Negative for issues
+        "unit_cost": issue_costs,
+        "total_value": (-issue_qtys * issue_costs).round(2),
+        "location_id": "WH01",
+        "reference_document": _format_ids("SALE-", RNG.integers(1000, 10000, n_issues)),
+        "employee_id": _choice(inventory_staff, n_issues)
+    }
+    transaction_id += n_issues
     
     # Stock Transfers
-    for _ in range(20):
-        item = random.choice(inventory_items_df.to_dict('records'))
-        transactions.append({
-            "transaction_id": f"INV-{transaction_id:06d}",
-            "transaction_date": date(2024, random.randint(1, 12), random.randint(1, 28)),
-            "transaction_type": "Stock Transfer",
-            "sku": item['sku'],
-            "batch_id": f"BATCH-{random.randint(1, 100):04d}",
-            "quantity": random.randint(10, 100),
-            "unit_cost": item['average_unit_cost'],
-            "total_value": round(random.randint(10, 100) * item['average_unit_cost'], 2),
-            "location_id": random.choice(["WH01", "WH02", "STORE01"]),
-            "reference_document": f"TRF-{random.randint(1000, 9999)}",
-            "employee_id": random.choice(inventory_staff)
-        })
-        transaction_id += 1
-    
-    return pd.DataFrame(transactions)
+    n_transfers = 20
+    transfer_idx = RNG.integers(0, len(skus), n_transfers)
+    transfer_qtys = RNG.integers(10, 101, n_transfers)
+    transfer_dates = _random_dates(n_transfers, 2024)
+    transfer_batches = RNG.integers(1, 101, n_transfers)
+    transfer_locations = _choice(["WH01", "WH02", "STORE01"], n_transfers)
+    transfer_refs = RNG.integers(1000, 10000, n_transfers)
+    transfer_staff = _choice(inventory_staff, n_transfers)
+    transfers = {
+        "transaction_id": _format_ids("INV-", np.arange(transaction_id, transaction_id + n_transfers), 6),
+        "transaction_date": transfer_dates,
+        "transaction_type": "Stock Transfer",
+        "sku": skus[transfer_idx],
+        "batch_id": _format_ids("BATCH-", transfer_batches, 4),
+        "quantity": transfer_qtys,
+        "unit_cost": costs[transfer_idx],
+        "total_value": (transfer_qtys * costs[transfer_idx]).round(2),
+        "location_id": transfer_locations,
+        "reference_document": _format_ids("TRF-", transfer_refs),
+        "employee_id": transfer_staff
+    }
+    
+    return _build_df("fact_inventory_transactions", receipts, issues, transfers)
 
 def generate_sales_transactions(inventory_items_df, customers_df, employees_df):
     """Generate sales transactions"""
-    sales = []
-    
     sales_staff = employees_df[employees_df['department'] == 'Sales & Marketing']['employee_id'].tolist()
-    customers = customers_df.to_dict('records')
-    inventory_items = inventory_items_df.to_dict('records')
-    
-    transaction_id = 1
-    for _ in range(500):  # Generate 500 sales transactions
-        customer = random.choice(customers)
-        item = random.choice(inventory_items)
-        
-        # Determine unit price (markup from cost)
-        markup = random.uniform(1.5, 3.0)  # 50-200% markup
-        unit_price = round(item['average_unit_cost'] * markup, 2)
-        
-        quantity = random.randint(1, 20)
-        total_amount = round(unit_price * quantity, 2)
-        
-        # Apply discounts for B2B customers
-        if customer['customer_type'] == 'Business':
-            discount_pct = random.uniform(0.05, 0.20)
-        else:
-            discount_pct = random.uniform(0, 0.10)
-        
-        discount_amount = round(total_amount * discount_pct, 2)
-        tax_amount = round((total_amount - discount_amount) * 0.16, 2)  # 16% VAT in Kenya
-        net_amount = round(total_amount - discount_amount + tax_amount, 2)
-        
-        sales_date = datetime(2024, random.randint(1, 12), random.randint(1, 28), 
-                            random.randint(8, 20), random.randint(0, 59))
-        
-        sales.append({
-            "transaction_id": f"SALE-{transaction_id:06d}",
-            "transaction_date": sales_date,
-            "customer_id": customer['customer_id'],
-            "sku": item['sku'],
-            "quantity": quantity,
-            "unit_price": unit_price,
-            "total_amount": total_amount,
-            "discount_amount": discount_amount,
-            "tax_amount": tax_amount,
-            "net_amount": net_amount,
-            "payment_method": random.choice(["M-Pesa", "Cash", "Bank Transfer", "Credit Card"]),
-            "payment_status": random.choice(["Paid", "Paid", "Paid", "Pending", "Partial"]),
-            "sales_channel": random.choice(["Retail Store", "Online", "Wholesale", "Distributor"]),
-            "employee_id": random.choice(sales_staff)
-        })
-        transaction_id += 1
-    
-    return pd.DataFrame(sales)
+    customer_ids = customers_df['customer_id'].to_numpy(dtype=object)
+    customer_types = customers_df['customer_type'].to_numpy(dtype=object)
+    skus = inventory_items_df['sku'].to_numpy(dtype=object)
+    unit_costs = inventory_items_df['average_unit_cost'].to_numpy(dtype=float)
+    
+    n_sales = 500  # Generate 500 sales transactions
+    customer_idx = RNG.integers(0, len(customer_ids), n_sales)
+    item_idx = RNG.integers(0, len(skus), n_sales)
+    markups = RNG.uniform(1.5, 3.0, n_sales)  # 50-200% markup
+    quantities = RNG.integers(1, 21, n_sales)
+    discount_draws = RNG.random(n_sales)
+    sales_dates = _random_timestamps(n_sales, 2024, 8, 20)
+    payment_methods = _choice(["M-Pesa", "Cash", "Bank Transfer", "Credit Card"], n_sales)
+    payment_statuses = _choice(["Paid", "Paid", "Paid", "Pending", "Partial"], n_sales)
+    channels = _choice(["Retail Store", "Online", "Wholesale", "Distributor"], n_sales)
+    staff = _choice(sales_staff, n_sales)
+    
+    # Determine unit price (markup from cost)
+    unit_price = (unit_costs[item_idx] * markups).round(2)
+    total_amount = (unit_price * quantities).round(2)
+    
+    # Apply discounts for B2B customers
+    discount_pct = np.where(customer_types[customer_idx] == 'Business',
+                            0.05 + discount_draws * 0.15,
+                            discount_draws * 0.10)
+    
+    discount_amount = (total_amount * discount_pct).round(2)
+    tax_amount = ((total_amount - discount_amount) * 0.16).round(2)  # 16% VAT in Kenya
+    net_amount = (total_amount - discount_amount + tax_amount).round(2)
+    
+    return _build_df("fact_sales_transactions", {
+        "transaction_id": _format_ids("SALE-", np.arange(1, n_sales + 1), 6),
+        "transaction_date": sales_dates,
+        "customer_id": customer_ids[customer_idx],
+        "sku": skus[item_idx],
+        "quantity": quantities,
+        "unit_price": unit_price,
+        "total_amount": total_amount,
+        "discount_amount": discount_amount,
+        "tax_amount": tax_amount,
+        "net_amount": net_amount,
+        "payment_method": payment_methods,
+        "payment_status": payment_statuses,
+        "sales_channel": channels,
+        "employee_id": staff
+    })
 
 def generate_ecommerce_orders(customers_df, sales_df):
     """Generate e-commerce orders"""
-    orders = []
-    
     # Filter for individual customers
-    b2c_customers = customers_df[customers_df['customer_type'] == 'Individual'].to_dict('records')
-    
-    order_id = 1
-    for _ in range(200):  # 200 online orders
-        customer = random.choice(b2c_customers)
-        
-        # Generate order date
-        order_date = datetime(2024, random.randint(1, 12), random.randint(1, 28),
-                            random.randint(0, 23), random.randint(0, 59))
-        
-        # Generate order amounts
-        subtotal = round(random.uniform(1000, 50000), 2)
-        shipping = round(random.uniform(200, 2000), 2)
-        tax = round(subtotal * 0.16, 2)
-        discount = round(subtotal * random.uniform(0, 0.15), 2)
-        net_amount = round(subtotal + shipping + tax - discount, 2)
-        
-        orders.append({
-            "order_id": f"ECOMM-{order_id:06d}",
-            "order_date": order_date,
-            "customer_id": customer['customer_id'],
-            "total_amount": subtotal,
-            "shipping_amount": shipping,
-            "tax_amount": tax,
-            "discount_amount": discount,
-            "net_amount": net_amount,
-            "payment_status": random.choice(["Paid", "Paid", "Paid", "Pending", "Failed"]),
-            "order_status": random.choice(["Delivered", "Shipped", "Processing", "Cancelled"]),
-            "shipping_method": random.choice(["Standard", "Express", "Pickup", "Courier"]),
-            "tracking_number": f"TRACK-{random.randint(1000000000, 9999999999)}",
-            "website_session_id": f"SESS-{random.randint(100000, 999999)}"
-        })
-        order_id += 1
-    
-    return pd.DataFrame(orders)
+    b2c_ids = customers_df.loc[customers_df['customer_type'] == 'Individual', 'customer_id'].to_numpy(dtype=object)
+    
+    n_orders = 200  # 200 online orders
+    customer_idx = RNG.integers(0, len(b2c_ids), n_orders)
+    order_dates = _random_timestamps(n_orders, 2024, 0, 23)
+    subtotal = RNG.uniform(1000, 50000, n_orders).round(2)
+    shipping = RNG.uniform(200, 2000, n_orders).round(2)
+    discount_rates = RNG.uniform(0, 0.15, n_orders)
+    payment_statuses = _choice(["Paid", "Paid", "Paid", "Pending", "Failed"], n_orders)
+    order_statuses = _choice(["Delivered", "Shipped", "Processing", "Cancelled"], n_orders)
+    shipping_methods = _choice(["Standard", "Express", "Pickup", "Courier"], n_orders)
+    tracking_numbers = RNG.integers(1000000000, 10000000000, n_orders)
+    session_numbers = RNG.integers(100000, 1000000, n_orders)
+    
+    # Generate order amounts
+    tax = (subtotal * 0.16).round(2)
+    discount = (subtotal * discount_rates).round(2)
+    net_amount = (subtotal + shipping + tax - discount).round(2)
+    
+    return _build_df("fact_ecommerce_orders", {
+        "order_id": _format_ids("ECOMM-", np.arange(1, n_orders + 1), 6),
+        "order_date": order_dates,
+        "customer_id": b2c_ids[customer_idx],
+        "total_amount": subtotal,
+        "shipping_amount": shipping,
+        "tax_amount": tax,
+        "discount_amount": discount,
+        "net_amount": net_amount,
+        "payment_status": payment_statuses,
+        "order_status": order_statuses,
+        "shipping_method": shipping_methods,
+        "tracking_number": _format_ids("TRACK-", tracking_numbers),
+        "website_session_id": _format_ids("SESS-", session_numbers)
+    })
+
+def _compute_attendance_hours(shift_start, shift_end, late, early):
+    """Derive actual start/end (minutes after midnight), hours worked and overtime from shift times and drift"""
+    actual_start = shift_start + late
+    actual_end = shift_end - early
+    
+    hours_worked = (actual_end - actual_start) / 60
+    overtime = np.maximum(hours_worked - 9, 0)  # Overtime after 9 hours
+    return actual_start, actual_end, hours_worked, overtime
 
 def generate_attendance_data(employees_df):
     """Generate attendance data for employees"""
-    attendance = []
-    
-    active_employees = employees_df[employees_df['active'] == True].to_dict('records')
-    attendance_id = 1
+    active_employees = employees_df[employees_df['active'] == True]
+    n_employees = len(active_employees)
+    
+    # One draw per (day, employee) slot for each random field, day-major
+    n_days = 30
+    n_slots = n_days * n_employees
+    weekend_draws = RNG.random(n_slots)
+    late_draws = RNG.random(n_slots)
+    late_minutes_arr = RNG.integers(0, 31, n_slots)
+    early_draws = RNG.random(n_slots)
+    early_minutes_arr = RNG.integers(0, 61, n_slots)
+    statuses = _choice(["Present", "Present", "Present", "Late", "Half Day"], n_slots)
+    remarks = _choice(["", "", "Traffic", "Family Emergency", "Medical Appointment"], n_slots)
     
     # Generate 30 days of attendance data
-    for day_offset in range(30):
-        current_date = date(2024, 6, 1) + timedelta(days=day_offset)
-        
-        for employee in active_employees:
-            # Skip weekends with 90% probability
-            if current_date.weekday() >= 5 and random.random() > 0.1:
-                continue
-            
-            # Determine shift based on pattern
-            if employee['shift_pattern'] == 'Morning':
-                shift_start = datetime.strptime('08:00', '%H:%M').time()
-                shift_end = datetime.strptime('17:00', '%H:%M').time()
-            elif employee['shift_pattern'] == 'Evening':
-                shift_start = datetime.strptime('14:00', '%H:%M').time()
-                shift_end = datetime.strptime('23:00', '%H:%M').time()
-            else:
-                shift_start = datetime.strptime('08:00', '%H:%M').time()
-                shift_end = datetime.strptime('17:00', '%H:%M').time()
-            
-            # Simulate actual times with some variance
-            late_minutes = random.randint(0, 30) if random.random() > 0.8 else 0
-            early_leave = random.randint(0, 60) if random.random() > 0.9 else 0
-            
-            actual_start = (datetime.combine(current_date, shift_start) + 
-                          timedelta(minutes=late_minutes)).time()
-            actual_end = (datetime.combine(current_date, shift_end) - 
-                         timedelta(minutes=early_leave)).time()
-            
-            hours_worked = ((datetime.combine(current_date, actual_end) - 
-                           datetime.combine(current_date, actual_start)).seconds / 3600)
-            
-            overtime = max(0, hours_worked - 9)  # Overtime after 9 hours
-            
-            attendance.append({
-                "attendance_id": f"ATT-{attendance_id:06d}",
-                "employee_id": employee['employee_id'],
-                "date": current_date,
-                "shift_start": shift_start,
-                "shift_end": shift_end,
-                "actual_start": actual_start,
-                "actual_end": actual_end,
-                "hours_worked": round(hours_worked, 2),
-                "overtime_hours": round(overtime, 2),
-                "attendance_status": random.choice(["Present", "Present", "Present", "Late", "Half Day"]),
-                "remarks": random.choice(["", "", "Traffic", "Family Emergency", "Medical Appointment"])
-            })
-            attendance_id += 1
-    
-    return pd.DataFrame(attendance)
+    days = pd.date_range("2024-06-01", periods=n_days)
+    slot_dates = np.repeat(days.date, n_employees)
+    
+    # Skip weekends with 90% probability; everything below works on the kept slots only
+    keep = np.flatnonzero(~(np.repeat(days.dayofweek >= 5, n_employees) & (weekend_draws > 0.1)))
+    n_rows = len(keep)
+    
+    # Determine shift based on pattern
+    shifts = [SHIFT_MINUTES.get(pattern, SHIFT_MINUTES["Morning"]) for pattern in active_employees['shift_pattern']]
+    shift_start = np.tile([start for start, _ in shifts], n_days)[keep]
+    shift_end = np.tile([end for _, end in shifts], n_days)[keep]
+    
+    # Simulate actual times with some variance
+    late = np.where(late_draws[keep] > 0.8, late_minutes_arr[keep], 0)
+    early = np.where(early_draws[keep] > 0.9, early_minutes_arr[keep], 0)
+    actual_start, actual_end, hours_worked, overtime = _compute_attendance_hours(shift_start, shift_end, late, early)
+    
+    return _build_df("fact_attendance", {
+        "attendance_id": _format_ids("ATT-", np.arange(1, n_rows + 1), 6),
+        "employee_id": np.tile(active_employees['employee_id'].to_numpy(dtype=object), n_days)[keep],
+        "date": slot_dates[keep],
+        "shift_start": _minutes_to_times(shift_start),
+        "shift_end": _minutes_to_times(shift_end),
+        "actual_start": _minutes_to_times(actual_start),
+        "actual_end": _minutes_to_times(actual_end),
+        "hours_worked": hours_worked.round(2),
+        "overtime_hours": overtime.round(2),
+        "attendance_status": statuses[keep],
+        "remarks": remarks[keep]
+    })
 
 def generate_financial_accounts():
     """Generate chart of accounts"""
-    accounts = []
-    
     account_structure = {
         "Assets": {
             "Current Assets": ["Cash", "Accounts Receivable", "Inventory", "Prepaid Expenses"],
@@ -909,117 +1075,102 @@ def generate_financial_accounts():
         }
     }
     
-    account_code = 1000
-    for main_category, subcategories in account_structure.items():
-        for subcategory, account_names in subcategories.items():
-            for account_name in account_names:
-                # Determine normal balance
-                if main_category in ["Assets", "Expenses"]:
-                    normal_balance = "Debit"
-                else:
-                    normal_balance = "Credit"
-                
-                # Generate opening balance
-                if main_category == "Assets":
-                    opening_balance = random.uniform(100000, 1000000)
-                elif main_category == "Liabilities":
-                    opening_balance = random.uniform(50000, 500000)
-                elif main_category == "Equity":
-                    opening_balance = random.uniform(500000, 2000000)
-                elif main_category == "Revenue":
-                    opening_balance = random.uniform(0, 100000)
-                else:  # Expenses
-                    opening_balance = random.uniform(0, 500000)
-                
-                accounts.append({
-                    "account_code": str(account_code),
-                    "account_name": account_name,
-                    "account_type": main_category,
-                    "category": subcategory,
-                    "normal_balance": normal_balance,
-                    "opening_balance": round(opening_balance, 2),
-                    "current_balance": round(opening_balance * random.uniform(0.8, 1.2), 2),
-                    "parent_account": "",
-                    "is_active": True
-                })
-                account_code += 1
-    
-    return pd.DataFrame(accounts)
+    # Opening balance ranges by account type
+    balance_ranges = {
+        "Assets": (100000, 1000000),
+        "Liabilities": (50000, 500000),
+        "Equity": (500000, 2000000),
+        "Revenue": (0, 100000),
+        "Expenses": (0, 500000)
+    }
+    
+    rows = [
+        (main_category, subcategory, account_name)
+        for main_category, subcategories in account_structure.items()
+        for subcategory, account_names in subcategories.items()
+        for account_name in account_names
+    ]
+    type_arr, category_arr, name_arr = (list(col) for col in zip(*rows))
+    n = len(rows)
+    
+    balance_draws = RNG.random(n)
+    balance_drift = RNG.uniform(0.8, 1.2, n)
+    
+    # Generate opening balance
+    low = np.array([balance_ranges[t][0] for t in type_arr])
+    high = np.array([balance_ranges[t][1] for t in type_arr])
+    opening_balance = low + balance_draws * (high - low)
+    
+    return _build_df("dim_accounts", {
+        "account_code": [str(code) for code in range(1000, 1000 + n)],
+        "account_name": name_arr,
+        "account_type": type_arr,
+        "category": category_arr,
+        "normal_balance": np.where(np.isin(type_arr, ["Assets", "Expenses"]), "Debit", "Credit"),
+        "opening_balance": opening_balance.round(2),
+        "current_balance": (opening_balance * balance_drift).round(2),
+        "parent_account": "",
+        "is_active": True
+    })
 
 def generate_financial_transactions(accounts_df, sales_df):
     """Generate financial transactions"""
-    transactions = []
-    
-    accounts = accounts_df.to_dict('records')
-    transaction_id = 1
-    
-    # Sales transactions
-    for _, sale in sales_df.iterrows():
-        if sale['payment_status'] == 'Paid':
-            # Debit: Cash/Bank, Credit: Sales Revenue
-            cash_account = next(acc for acc in accounts if "Cash" in acc['account_name'] or "Bank" in acc['account_name'])
-            sales_account = next(acc for acc in accounts if "Sales" in acc['account_name'])
-            
-            transactions.append({
-                "transaction_id": f"FIN-{transaction_id:06d}",
-                "transaction_date": sale['transaction_date'].date(),
-                "transaction_type": "Sales Receipt",
-                "account_code": cash_account['account_code'],
-                "description": f"Sale to {sale['customer_id']}",
-                "debit_amount": sale['net_amount'],
-                "credit_amount": 0,
-                "balance": cash_account['current_balance'] + sale['net_amount'],
-                "reference_number": sale['transaction_id'],
-                "vendor_customer_id": sale['customer_id'],
-                "payment_method": sale['payment_method'],
-                "status": "Posted"
-            })
-            transaction_id += 1
-            
-            transactions.append({
-                "transaction_id": f"FIN-{transaction_id:06d}",
-                "transaction_date": sale['transaction_date'].date(),
-                "transaction_type": "Sales Revenue",
-                "account_code": sales_account['account_code'],
-                "description": f"Sale to {sale['customer_id']}",
-                "debit_amount": 0,
-                "credit_amount": sale['net_amount'] - sale['tax_amount'],
-                "balance": sales_account['current_balance'] + (sale['net_amount'] - sale['tax_amount']),
-                "reference_number": sale['transaction_id'],
-                "vendor_customer_id": sale['customer_id'],
-                "payment_method": "",
-                "status": "Posted"
-            })
-            transaction_id += 1
+    # Sales transactions: Debit Cash/Bank, Credit Sales Revenue, as alternating rows per paid sale
+    cash_account = accounts_df[accounts_df['account_name'].str.contains("Cash|Bank")].iloc[0]
+    sales_account = accounts_df[accounts_df['account_name'].str.contains("Sales")].iloc[0]
+    paid = sales_df[sales_df['payment_status'] == 'Paid']
+    n_paid = len(paid)
+    net = paid['net_amount'].to_numpy(dtype=float)
+    revenue = net - paid['tax_amount'].to_numpy(dtype=float)
+    customer_ids = paid['customer_id'].to_numpy(dtype=object)
+    zeros = np.zeros(n_paid)
+    sales_entries = {
+        "transaction_id": _format_ids("FIN-", np.arange(1, 2 * n_paid + 1), 6),
+        "transaction_date": np.repeat(paid['transaction_date'].dt.date.to_numpy(), 2),
+        "transaction_type": np.tile(["Sales Receipt", "Sales Revenue"], n_paid),
+        "account_code": np.tile([cash_account['account_code'], sales_account['account_code']], n_paid),
+        "description": np.repeat("Sale to " + customer_ids, 2),
+        "debit_amount": _interleave(net, zeros),
+        "credit_amount": _interleave(zeros, revenue),
+        "balance": _interleave(cash_account['current_balance'] + net, sales_account['current_balance'] + revenue),
+        "reference_number": np.repeat(paid['transaction_id'].to_numpy(dtype=object), 2),
+        "vendor_customer_id": np.repeat(customer_ids, 2),
+        "payment_method": _interleave(paid['payment_method'].to_numpy(dtype=object), np.full(n_paid, "", dtype=object)),
+        "status": "Posted"
+    }
+    transaction_id = 2 * n_paid + 1
     
     # Expense transactions
-    for _ in range(100):
-        expense_date = date(2024, random.randint(1, 12), random.randint(1, 28))
-        expense_account = random.choice([acc for acc in accounts if acc['account_type'] == 'Expenses'])
-        amount = round(random.uniform(1000, 50000), 2)
-        
-        transactions.append({
-            "transaction_id": f"FIN-{transaction_id:06d}",
-            "transaction_date": expense_date,
-            "transaction_type": "Expense Payment",
-            "account_code": expense_account['account_code'],
-            "description": random.choice(["Office Supplies", "Utility Bill", "Marketing Campaign", "Equipment Maintenance"]),
-            "debit_amount": amount,
-            "credit_amount": 0,
-            "balance": expense_account['current_balance'] + amount,
-            "reference_number": f"EXP-{random.randint(1000, 9999)}",
-            "vendor_customer_id": f"VEND-{random.randint(1, 50):03d}",
-            "payment_method": random.choice(["Bank Transfer", "M-Pesa", "Cheque"]),
-            "status": "Posted"
-        })
-        transaction_id += 1
-    
-    return pd.DataFrame(transactions)
+    n_expenses = 100
+    expense_dates = _random_dates(n_expenses, 2024)
+    amounts = RNG.uniform(1000, 50000, n_expenses).round(2)
+    descriptions = _choice(["Office Supplies", "Utility Bill", "Marketing Campaign", "Equipment Maintenance"], n_expenses)
+    expense_refs = RNG.integers(1000, 10000, n_expenses)
+    vendors = RNG.integers(1, 51, n_expenses)
+    payment_methods = _choice(["Bank Transfer", "M-Pesa", "Cheque"], n_expenses)
+    expense_accounts = accounts_df[accounts_df['account_type'] == 'Expenses']
+    expense_codes = expense_accounts['account_code'].to_numpy(dtype=object)
+    expense_balances = expense_accounts['current_balance'].to_numpy(dtype=float)
+    expense_idx = RNG.integers(0, len(expense_codes), n_expenses)
+    expenses = {
+        "transaction_id": _format_ids("FIN-", np.arange(transaction_id, transaction_id + n_expenses), 6),
+        "transaction_date": expense_dates,
+        "transaction_type": "Expense Payment",
+        "account_code": expense_codes[expense_idx],
+        "description": descriptions,
+        "debit_amount": amounts,
+        "credit_amount": 0.0,
+        "balance": expense_balances[expense_idx] + amounts,
+        "reference_number": _format_ids("EXP-", expense_refs),
+        "vendor_customer_id": _format_ids("VEND-", vendors, 3),
+        "payment_method": payment_methods,
+        "status": "Posted"
+    }
+    
+    return _build_df("fact_financial_transactions", sales_entries, expenses)
 
 def generate_website_traffic():
     """Generate website traffic data"""
-    traffic = []
-    
     pages = [
         "/", "/products", "/products/skincare", "/products/haircare", 
         "/about", "/contact", "/cart", "/checkout", "/blog"
@@ -1028,198 +1179,230 @@ def generate_website_traffic():
     devices = ["Desktop", "Mobile", "Tablet"]
     locations = ["Nairobi", "Mombasa", "Kisumu", "Nakuru", "Eldoret", "International"]
     
-    session_id = 1
-    for day_offset in range(30):
-        current_date = date(2024, 6, 1) + timedelta(days=day_offset)
-        
-        # Generate sessions per day
-        for _ in range(random.randint(50, 200)):
-            session_start = datetime.combine(current_date, 
-                                           datetime.strptime(f"{random.randint(8, 22)}:{random.randint(0, 59)}", "%H:%M").time())
-            
-            # Generate page views for this session
-            page_views = random.randint(1, 10)
-            session_duration = random.randint(30, 1800)  # 30 seconds to 30 minutes
-            
-            for view in range(page_views):
-                view_time = session_start + timedelta(seconds=random.randint(0, session_duration))
-                
-                # 5% conversion rate
-                converted = random.random() < 0.05
-                customer_id = f"B2C-{random.randint(1000, 1050):04d}" if converted else ""
-                
-                traffic.append({
-                    "session_id": f"SESS-{session_id:06d}",
-                    "timestamp": view_time,
-                    "page_url": random.choice(pages),
-                    "referrer": random.choice(["Direct", "Google", "Facebook", "Instagram", "Email"]),
-                    "device_type": random.choice(devices),
-                    "location": random.choice(locations),
-                    "session_duration_seconds": session_duration,
-                    "page_views": page_views,
-                    "converted": converted,
-                    "customer_id": customer_id
-                })
-            
-            session_id += 1
-    
-    return pd.DataFrame(traffic)
+    # Session-level draws, then page-view-level draws sized to the total view count
+    n_days = 30
+    sessions_per_day = RNG.integers(50, 201, n_days)
+    n_sessions = int(sessions_per_day.sum())
+    start_hours = RNG.integers(8, 23, n_sessions)
+    start_minutes = RNG.integers(0, 60, n_sessions)
+    page_view_counts = RNG.integers(1, 11, n_sessions)
+    durations = RNG.integers(30, 1801, n_sessions)  # 30 seconds to 30 minutes
+    
+    n_views = int(page_view_counts.sum())
+    view_offsets = RNG.integers(0, np.repeat(durations, page_view_counts) + 1)
+    converted = RNG.random(n_views) < 0.05  # 5% conversion rate
+    customer_numbers = RNG.integers(1000, 1051, n_views)
+    page_urls = _choice(pages, n_views)
+    referrers = _choice(["Direct", "Google", "Facebook", "Instagram", "Email"], n_views)
+    device_types = _choice(devices, n_views)
+    view_locations = _choice(locations, n_views)
+    
+    # Session starts on their day, then each page view offset into its session
+    session_days = np.repeat(pd.date_range("2024-06-01", periods=n_days).to_numpy(), sessions_per_day)
+    session_starts = (session_days + start_hours * np.timedelta64(1, "h")
+                      + start_minutes * np.timedelta64(1, "m"))
+    view_times = np.repeat(session_starts, page_view_counts) + view_offsets * np.timedelta64(1, "s")
+    
+    session_ids = np.array(_format_ids("SESS-", np.arange(1, n_sessions + 1), 6), dtype=object)
+    customer_ids = np.where(converted, _format_ids("B2C-", customer_numbers, 4), "")
+    
+    return _build_df("fact_website_traffic", {
+        "session_id": np.repeat(session_ids, page_view_counts),
+        "timestamp": view_times,
+        "page_url": page_urls,
+        "referrer": referrers,
+        "device_type": device_types,
+        "location": view_locations,
+        "session_duration_seconds": np.repeat(durations, page_view_counts),
+        "page_views": np.repeat(page_view_counts, page_view_counts),
+        "converted": converted,
+        "customer_id": customer_ids
+    })
 
 def generate_production_analytics(batches_df):
     """Generate production analytics data"""
-    analytics = []
-    
-    analytics_id = 1
-    for _, batch in batches_df.iterrows():
-        if batch['status'] == 'Completed':
-            oee = random.uniform(70, 95)  # Overall Equipment Effectiveness
-            downtime = batch['completion_time_hours'] * random.uniform(0.05, 0.20)  # 5-20% downtime
-            
-            analytics.append({
-                "analytics_id": f"PROD-ANAL-{analytics_id:04d}",
-                "date": batch['production_date'],
-                "batch_id": batch['batch_id'],
-                "equipment_id": batch['equipment_id'],
-                "oee_percentage": round(oee, 2),
-                "yield_rate": round(batch['yield_percentage'], 2),
-                "cycle_time_hours": round(batch['completion_time_hours'], 2),
-                "downtime_hours": round(downtime, 2),
-                "quality_score": round(batch['quality_score'], 1),
-                "cost_variance": round(random.uniform(-0.1, 0.1) * batch['total_cost'], 2),
-                "energy_consumption": round(batch['total_cost'] * random.uniform(0.05, 0.15), 2),
-                "scrap_percentage": round(100 - batch['yield_percentage'], 2)
-            })
-            analytics_id += 1
-    
-    return pd.DataFrame(analytics)
+    completed = batches_df[batches_df['status'] == 'Completed']
+    n_completed = len(completed)
+    oee = RNG.uniform(70, 95, n_completed)  # Overall Equipment Effectiveness
+    downtime_ratios = RNG.uniform(0.05, 0.20, n_completed)  # 5-20% downtime
+    cost_variances = RNG.uniform(-0.1, 0.1, n_completed)
+    energy_ratios = RNG.uniform(0.05, 0.15, n_completed)
+    
+    cycle_time = completed['completion_time_hours'].to_numpy(dtype=float)
+    yield_pct = completed['yield_percentage'].to_numpy(dtype=float)
+    total_cost = completed['total_cost'].to_numpy(dtype=float)
+    
+    return _build_df("fact_production_analytics", {
+        "analytics_id": _format_ids("PROD-ANAL-", np.arange(1, n_completed + 1), 4),
+        "date": completed['production_date'].to_numpy(),
+        "batch_id": completed['batch_id'].to_numpy(dtype=object),
+        "equipment_id": completed['equipment_id'].to_numpy(dtype=object),
+        "oee_percentage": oee.round(2),
+        "yield_rate": yield_pct.round(2),
+        "cycle_time_hours": cycle_time.round(2),
+        "downtime_hours": (cycle_time * downtime_ratios).round(2),
+        "quality_score": completed['quality_score'].to_numpy(dtype=float).round(1),
+        "cost_variance": (cost_variances * total_cost).round(2),
+        "energy_consumption": (total_cost * energy_ratios).round(2),
+        "scrap_percentage": (100 - yield_pct).round(2)
+    })
+
+def _compute_inventory_metrics(current_stock, total_value, total_issues):
+    """Derive turnover, days of inventory outstanding and ABC class per (item, date) row"""
+    in_stock = current_stock > 0
+    turnover_rate = np.divide(total_issues, current_stock, out=np.zeros(len(current_stock)), where=in_stock)
+    days_inventory = np.divide(365, turnover_rate, out=np.full(len(turnover_rate), 365.0), where=turnover_rate > 0)
+    days_inventory[~in_stock] = 0
+    
+    # ABC classification
+    abc_class = np.select([total_value > 100000, total_value > 50000], ['A', 'B'], 'C')
+    return turnover_rate, days_inventory, abc_class
 
 def generate_inventory_analytics(inventory_items_df, inventory_transactions_df):
     """Generate inventory analytics data"""
-    analytics = []
-    
-    analytics_id = 1
-    for _, item in inventory_items_df.iterrows():
-        # Calculate days for analysis
-        for month in range(1, 13):
-            analysis_date = date(2024, month, 15)
-            
-            # Get transactions for this item
-            item_transactions = inventory_transactions_df[
-                (inventory_transactions_df['sku'] == item['sku']) &
-                (inventory_transactions_df['transaction_date'] <= analysis_date)
-            ]
-            
-            if not item_transactions.empty:
-                # Calculate metrics
-                total_issues = abs(item_transactions[item_transactions['transaction_type'] == 'Sales Issue']['quantity'].sum())
-                avg_inventory = item['current_stock']
-                
-                if avg_inventory > 0:
-                    turnover_rate = total_issues / avg_inventory
-                    days_inventory = 365 / turnover_rate if turnover_rate > 0 else 365
-                else:
-                    turnover_rate = 0
-                    days_inventory = 0
-                
-                # ABC classification
-                if item['total_value'] > 100000:
-                    abc_class = 'A'
-                elif item['total_value'] > 50000:
-                    abc_class = 'B'
-                else:
-                    abc_class = 'C'
-                
-                analytics.append({
-                    "analytics_id": f"INV-ANAL-{analytics_id:04d}",
-                    "date": analysis_date,
-                    "sku": item['sku'],
-                    "category": item['category'],
-                    "stock_turnover_rate": round(turnover_rate, 2),
-                    "days_inventory_outstanding": round(days_inventory, 1),
-                    "stockout_frequency": round(random.uniform(0, 0.2), 3),
-                    "holding_cost_percentage": round(random.uniform(0.15, 0.35), 2),
-                    "abc_classification": abc_class,
-                    "excess_stock_value": round(item['total_value'] * random.uniform(0, 0.3), 2),
-                    "stockout_value": round(item['total_value'] * random.uniform(0, 0.1), 2),
-                    "forecast_accuracy": round(random.uniform(0.7, 0.95), 3)
-                })
-                analytics_id += 1
-    
-    return pd.DataFrame(analytics)
+    # Enough draws for every (item, month) pair; rows only consume them as they are emitted
+    n_slots = len(inventory_items_df) * 12
+    stockout_freqs = RNG.uniform(0, 0.2, n_slots)
+    holding_costs = RNG.uniform(0.15, 0.35, n_slots)
+    excess_ratios = RNG.uniform(0, 0.3, n_slots)
+    stockout_ratios = RNG.uniform(0, 0.1, n_slots)
+    forecast_accuracies = RNG.uniform(0.7, 0.95, n_slots)
+    
+    # Transactions counted into a (sku x analysis month) grid once, then accumulated over the months,
+    # so cell [s, m] covers everything for that SKU dated on or before the month's analysis date
+    sku_pos = pd.Index(inventory_items_df['sku']).get_indexer(inventory_transactions_df['sku'])
+    tx_dates = pd.to_datetime(inventory_transactions_df['transaction_date']).to_numpy().astype("datetime64[D]")
+    first_period = np.searchsorted(np.array(ANALYSIS_DATES, dtype="datetime64[D]"), tx_dates)
+    known = sku_pos >= 0
+    is_issue = known & (inventory_transactions_df['transaction_type'] == 'Sales Issue').to_numpy()
+    tx_counts = np.zeros((len(inventory_items_df), 13), dtype=np.int64)
+    issued_qty = np.zeros((len(inventory_items_df), 13), dtype=np.int64)
+    np.add.at(tx_counts, (sku_pos[known], first_period[known]), 1)
+    np.add.at(issued_qty, (sku_pos[is_issue], first_period[is_issue]),
+              inventory_transactions_df['quantity'].to_numpy()[is_issue])
+    tx_counts = tx_counts.cumsum(axis=1)
+    issued_qty = np.abs(issued_qty.cumsum(axis=1))
+    
+    # One row per (item, analysis date) that has transactions, item-major like the draws
+    item_pos, period = np.nonzero(tx_counts[:, :len(ANALYSIS_DATES)])
+    n_rows = len(item_pos)
+    total_values = inventory_items_df['total_value'].to_numpy(dtype=float)[item_pos]
+    turnover_rate, days_inventory, abc_class = _compute_inventory_metrics(
+        inventory_items_df['current_stock'].to_numpy()[item_pos],
+        total_values,
+        issued_qty[item_pos, period]
+    )
+    
+    return _build_df("fact_inventory_analytics", {
+        "analytics_id": _format_ids("INV-ANAL-", np.arange(1, n_rows + 1), 4),
+        "date": np.array(ANALYSIS_DATES, dtype=object)[period],
+        "sku": inventory_items_df['sku'].to_numpy(dtype=object)[item_pos],
+        "category": inventory_items_df['category'].to_numpy(dtype=object)[item_pos],
+        "stock_turnover_rate": turnover_rate.round(2),
+        "days_inventory_outstanding": days_inventory.round(1),
+        "stockout_frequency": stockout_freqs[:n_rows].round(3),
+        "holding_cost_percentage": holding_costs[:n_rows].round(2),
+        "abc_classification": abc_class,
+        "excess_stock_value": (total_values * excess_ratios[:n_rows]).round(2),
+        "stockout_value": (total_values * stockout_ratios[:n_rows]).round(2),
+        "forecast_accuracy": forecast_accuracies[:n_rows].round(3)
+    })
 
 def generate_audit_logs(tenants_df, employees_df, sales_df):
     """Generate audit log data"""
-    logs = []
-    
-    users = employees_df[['employee_id', 'position']].to_dict('records')
-    
-    log_id = 1
-    for day_offset in range(90):  # 90 days of logs
-        log_date = datetime(2024, 3, 1) + timedelta(days=day_offset)
-        
-        # Generate logs per day
-        for _ in range(random.randint(10, 50)):
-            user = random.choice(users)
-            tenant = random.choice(tenants_df['tenant_id'].tolist())
-            
-            # Determine module and action based on user role
-            if 'Manager' in user['position']:
-                module = random.choice(['Production', 'Inventory', 'Sales', 'Finance', 'HR'])
-            elif 'Sales' in user['position']:
-                module = 'Sales'
-            elif 'Production' in user['position']:
-                module = 'Production'
-            else:
-                module = random.choice(['System', 'Inventory', 'HR'])
-            
-            actions = {
-                'Production': ['CREATE_BATCH', 'UPDATE_FORMULATION', 'VIEW_REPORT', 'APPROVE_QC'],
-                'Inventory': ['ADD_STOCK', 'ISSUE_STOCK', 'TRANSFER', 'ADJUST'],
-                'Sales': ['CREATE_ORDER', 'PROCESS_PAYMENT', 'ISSUE_INVOICE', 'VIEW_CUSTOMER'],
-                'Finance': ['POST_TRANSACTION', 'GENERATE_REPORT', 'APPROVE_PAYMENT', 'RECONCILE'],
-                'HR': ['ADD_EMPLOYEE', 'UPDATE_SALARY', 'APPROVE_LEAVE', 'GENERATE_PAYROLL'],
-                'System': ['LOGIN', 'LOGOUT', 'CHANGE_SETTING', 'VIEW_AUDIT']
-            }
-            
-            action = random.choice(actions.get(module, ['VIEW', 'UPDATE']))
-            
-            # Generate IP address
-            ip = f"192.168.{random.randint(1, 255)}.{random.randint(1, 255)}"
-            
-            logs.append({
-                "log_id": f"AUDIT-{log_id:08d}",
-                "timestamp": log_date.replace(hour=random.randint(8, 20), 
-                                            minute=random.randint(0, 59),
-                                            second=random.randint(0, 59)),
-                "tenant_id": tenant,
-                "user_id": user['employee_id'],
-                "user_role": user['position'],
-                "module": module,
-                "action": action,
-                "resource": random.choice(['Batch', 'Product', 'Customer', 'Order', 'Employee', 'Transaction']),
-                "resource_id": random.choice([f"BATCH-{random.randint(1, 100):04d}", 
-                                            f"PROD-{random.randint(1, 50):04d}",
-                                            f"CUST-{random.randint(1, 100):04d}"]),
-                "ip_address": ip,
-                "success": random.choice([True, True, True, False]),
-                "details": f"{action} operation on {module} module"
-            })
-            log_id += 1
-    
-    return pd.DataFrame(logs)
+    user_ids = employees_df['employee_id'].to_numpy(dtype=object)
+    positions = employees_df['position'].to_numpy(dtype=str)
+    tenant_ids = tenants_df['tenant_id'].tolist()
+    
+    n_days = 90  # 90 days of logs
+    logs_per_day = RNG.integers(10, 51, n_days)
+    n_logs = int(logs_per_day.sum())
+    user_idx = RNG.integers(0, len(user_ids), n_logs)
+    tenants = _choice(tenant_ids, n_logs)
+    manager_modules = _choice(['Production', 'Inventory', 'Sales', 'Finance', 'HR'], n_logs)
+    other_modules = _choice(['System', 'Inventory', 'HR'], n_logs)
+    action_draws = RNG.random(n_logs)
+    ip_parts = RNG.integers(1, 256, (n_logs, 2))
+    log_hours = RNG.integers(8, 21, n_logs)
+    log_minutes = RNG.integers(0, 60, n_logs)
+    log_seconds = RNG.integers(0, 60, n_logs)
+    resources = _choice(['Batch', 'Product', 'Customer', 'Order', 'Employee', 'Transaction'], n_logs)
+    resource_kinds = RNG.integers(0, 3, n_logs)
+    resource_batches = RNG.integers(1, 101, n_logs)
+    resource_products = RNG.integers(1, 51, n_logs)
+    resource_customers = RNG.integers(1, 101, n_logs)
+    successes = _choice([True, True, True, False], n_logs)
+    
+    # Determine module and action based on user role
+    user_positions = positions[user_idx]
+    modules = np.select(
+        [np.char.find(user_positions, 'Manager') >= 0,
+         np.char.find(user_positions, 'Sales') >= 0,
+         np.char.find(user_positions, 'Production') >= 0],
+        [manager_modules, 'Sales', 'Production'],
+        default=other_modules
+    )
+    actions = np.empty(n_logs, dtype=object)
+    for module in np.unique(modules):
+        in_module = modules == module
+        module_actions = np.array(ACTIONS_BY_MODULE.get(module, ('VIEW', 'UPDATE')), dtype=object)
+        actions[in_module] = module_actions[(action_draws[in_module] * len(module_actions)).astype(int)]
+    
+    log_days = np.repeat(pd.date_range("2024-03-01", periods=n_days).to_numpy(), logs_per_day)
+    timestamps = (log_days + log_hours * np.timedelta64(1, "h") + log_minutes * np.timedelta64(1, "m")
+                  + log_seconds * np.timedelta64(1, "s"))
+    
+    # Generate IP address
+    ip_addresses = np.char.add(np.char.add(np.char.add("192.168.", ip_parts[:, 0].astype(str)), "."),
+                               ip_parts[:, 1].astype(str))
+    
+    resource_ids = np.choose(resource_kinds, [
+        _format_ids("BATCH-", resource_batches, 4),
+        _format_ids("PROD-", resource_products, 4),
+        _format_ids("CUST-", resource_customers, 4)
+    ])
+    
+    return _build_df("fact_audit_logs", {
+        "log_id": _format_ids("AUDIT-", np.arange(1, n_logs + 1), 8),
+        "timestamp": timestamps,
+        "tenant_id": tenants,
+        "user_id": user_ids[user_idx],
+        "user_role": user_positions,
+        "module": modules,
+        "action": actions,
+        "resource": resources,
+        "resource_id": resource_ids,
+        "ip_address": ip_addresses,
+        "success": successes,
+        "details": actions + " operation on " + modules.astype(object) + " module"
+    })
+
+def _has_schema_dtype(series: pd.Series, dtype, expected_type: str, low_card: bool) -> bool:
+    """Whether a column is already stored the way validate_table would convert it"""
+    if expected_type == "date":
+        return dtype == object and pd.api.types.infer_dtype(series, skipna=True) == "date"
+    if expected_type == "datetime":
+        return pd.api.types.is_datetime64_dtype(dtype)
+    if expected_type == "bool":
+        return dtype == bool
+    if expected_type == "int":
+        return dtype == np.int64
+    if expected_type == "float":
+        return dtype == np.float64
+    return isinstance(dtype, pd.CategoricalDtype) if low_card else dtype == STRING_DTYPE
 
 def validate_table(table_name: str, df: pd.DataFrame) -> tuple:
     """Validate generated data against schema"""
     if table_name not in SCHEMAS:
         return df, {"errors": ["Unknown table"], "warnings": [], "ok": False}
     
-    schema = SCHEMAS[table_name]
+    low_card = LOW_CARD_COLS.get(table_name, frozenset())
     errors = []
     warnings = []
     
     # Check required columns
-    required_cols = set(schema["required"].keys())
-    actual_cols = set(df.columns)
+    required_cols = _REQUIRED_SETS[table_name]
+    actual_cols = frozenset(df.columns)
     
     missing_cols = required_cols - actual_cols
     extra_cols = actual_cols - required_cols
@@ -1230,9 +1413,10 @@ def validate_table(table_name: str, df: pd.DataFrame) -> tuple:
     if extra_cols:
         warnings.append(f"Extra columns: {extra_cols}")
     
-    # Check data types
-    for col, expected_type in schema["required"].items():
-        if col in df.columns:
+    # Check data types, leaving columns that already have their target dtype untouched
+    dtypes = df.dtypes
+    for col, expected_type in _REQUIRED_ITEMS[table_name]:
+        if col in actual_cols and not _has_schema_dtype(df[col], dtypes[col], expected_type, col in low_card):
             try:
                 if expected_type == "date":
                     df[col] = pd.to_datetime(df[col]).dt.date
@@ -1240,20 +1424,25 @@ def validate_table(table_name: str, df: pd.DataFrame) -> tuple:
                     df[col] = pd.to_datetime(df[col])
                 elif expected_type == "bool":
                     df[col] = df[col].astype(bool)
-                elif expected_type == "int":
-                    df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0).astype(int)
-                elif expected_type == "float":
-                    df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0.0).astype(float)
-                else:  # str
-                    df[col] = df[col].astype(str)
+                elif expected_type in ("int", "float"):
+                    # One column-wide parse; cells it cannot read are counted from its mask and zero-filled
+                    numbers = pd.to_numeric(df[col], errors='coerce')
+                    unparsed = int((numbers.isna() & df[col].notna()).sum())
+                    if unparsed:
+                        warnings.append(f"Column {col} has {unparsed} non-numeric values (set to 0)")
+                    df[col] = numbers.fillna(0).astype(int if expected_type == "int" else float)
+                else:  # str, stored Arrow-backed rather than as Python objects
+                    df[col] = df[col].astype(STRING_DTYPE)
+                    if col in low_card:
+                        df[col] = df[col].astype("category")
             except Exception as e:
                 errors.append(f"Type conversion failed for {col}: {str(e)}")
     
-    # Check for nulls in required columns
-    for col in required_cols:
-        if col in df.columns and df[col].isnull().any():
-            null_count = df[col].isnull().sum()
-            warnings.append(f"Column {col} has {null_count} null values")
+    # Check for nulls in required columns, counted in one pass over the frame
+    present_cols = [col for col, _ in _REQUIRED_ITEMS[table_name] if col in actual_cols]
+    null_counts = df[present_cols].isna().sum()
+    for col, null_count in null_counts[null_counts > 0].items():
+        warnings.append(f"Column {col} has {null_count} null values")
     
     return df, {
         "row_count": len(df),
@@ -1275,87 +1464,176 @@ def summarize_dq(report: dict) -> pd.DataFrame:
     }
     return pd.DataFrame(summary)
 
+def _read_csv_upload(uploaded, table_name: str) -> pd.DataFrame:
+    """Parse an uploaded CSV in Arrow with the target table's column types, falling back to pandas inference"""
+    try:
+        table = pacsv.read_csv(
+            uploaded,
+            read_options=pacsv.ReadOptions(use_threads=True, block_size=32 << 20),
+            convert_options=pacsv.ConvertOptions(column_types=dict(_ARROW_COLUMN_TYPES[table_name]))
+        )
+    except pa.ArrowInvalid:
+        # A cell that does not parse as its schema type; let validate_table coerce it as before
+        uploaded.seek(0)
+        return pd.read_csv(uploaded)
+    return table.to_pandas(types_mapper=_PANDAS_TYPES)
+
+def _read_parquet_upload(uploaded, table_name: str) -> pd.DataFrame:
+    """Read only the target table's columns from an uploaded Parquet file, held in memory with pre-buffered reads"""
+    parquet_file = pq.ParquetFile(pa.BufferReader(uploaded.getvalue()), pre_buffer=True)
+    present = set(parquet_file.schema_arrow.names)
+    columns = [col for col, _ in _REQUIRED_ITEMS[table_name] if col in present]
+    return parquet_file.read(columns=columns, use_threads=True).to_pandas(types_mapper=_PANDAS_TYPES)
+
+# The raw bytes are passed underscore-prefixed; the cache is keyed on their digest instead
+@st.cache_data(max_entries=4, show_spinner=False)
+def _load_upload(table_name: str, file_name: str, digest: bytes, _raw: bytes) -> tuple:
+    """Parse and validate an uploaded file once per table, file name and content digest"""
+    source = BytesIO(_raw)
+    if file_name.lower().endswith(".csv"):
+        df = _read_csv_upload(source, table_name)
+    elif file_name.lower().endswith((".xlsx", ".xls")):
+        df = pd.read_excel(source)
+    else:
+        df = _read_parquet_upload(source, table_name)
+    return validate_table(table_name, df)
+
+# xlsxwriter options for streaming exports: rows are flushed as soon as the next one starts,
+# and string cells are written as-is instead of being scanned for URLs or numbers
+_EXCEL_OPTIONS = MappingProxyType({
+    "constant_memory": True,
+    "strings_to_urls": False,
+    "strings_to_numbers": False,
+    "nan_inf_to_errors": True,
+})
+
+# Excel number formats for temporal columns, matching what pandas' Excel writer used
+_EXCEL_DATE_FORMAT = "YYYY-MM-DD"
+_EXCEL_DATETIME_FORMAT = "YYYY-MM-DD HH:MM:SS"
+
+def _excel_bytes(table: pa.Table, sheet_name: str = "Data") -> bytes:
+    """Encode table as an XLSX workbook, streaming it row by row"""
+    output = BytesIO()
+    workbook = xlsxwriter.Workbook(output, dict(_EXCEL_OPTIONS))
+    worksheet = workbook.add_worksheet(sheet_name)
+    worksheet.write_row(0, 0, table.column_names)
+    # Timestamps keep their time of day; only date columns are shown as bare dates
+    date_format = workbook.add_format({"num_format": _EXCEL_DATE_FORMAT})
+    datetime_format = workbook.add_format({"num_format": _EXCEL_DATETIME_FORMAT})
+    # One typed writer per column from the schema, so cells skip worksheet.write's per-value type dispatch
+    writers = []
+    for field in table.schema:
+        field_type = field.type.value_type if pa.types.is_dictionary(field.type) else field.type
+        if pa.types.is_timestamp(field_type):
+            writers.append((worksheet.write_datetime, datetime_format))
+        elif pa.types.is_date(field_type):
+            writers.append((worksheet.write_datetime, date_format))
+        elif pa.types.is_boolean(field_type):
+            writers.append((worksheet.write_boolean, None))
+        elif pa.types.is_integer(field_type) or pa.types.is_floating(field_type):
+            writers.append((worksheet.write_number, None))
+        elif pa.types.is_string(field_type) or pa.types.is_large_string(field_type):
+            writers.append((worksheet.write_string, None))
+        else:
+            writers.append((worksheet.write, None))
+    # Each column becomes Python values in one conversion, then rows are zipped across them; nulls stay blank
+    for row, record in enumerate(zip(*(column.to_pylist() for column in table.columns)), start=1):
+        for col, (value, (write, cell_format)) in enumerate(zip(record, writers)):
+            if value is not None:
+                write(row, col, value, cell_format)
+    workbook.close()
+    return output.getvalue()
+
+def _to_arrow(table_name: str, df: pd.DataFrame) -> pa.Table:
+    """Columnar form a validated table is kept in across reruns"""
+    # Columns outside the schema are never cast by validate_table and may mix types; keep them as text
+    extra_objects = [col for col in df.columns if col not in _REQUIRED_SETS[table_name] and df[col].dtype == object]
+    if extra_objects:
+        df = df.astype(dict.fromkeys(extra_objects, STRING_DTYPE))
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+def _table_fingerprint(table: pa.Table) -> bytes:
+    """Content digest of a loaded table, taken over its Arrow IPC stream (schema and every buffer)"""
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return hashlib.blake2b(sink.getvalue(), digest_size=16).digest()
+
+def _stored_table(table_name: str, df: pd.DataFrame) -> tuple:
+    """Session-store entry for a validated table: its Arrow form and content digest, computed once on the way in"""
+    table = _to_arrow(table_name, df)
+    return table, _table_fingerprint(table)
+
+# The table itself is passed underscore-prefixed so Streamlit keys the cache on the digest instead of hashing the table again
+@st.cache_data(max_entries=8, show_spinner=False)
+def _csv_bytes(table_name: str, fingerprint: bytes, _table: pa.Table) -> bytes:
+    """CSV download payload for a loaded table, reused across reruns"""
+    # Arrow's writer formats whole record batches straight into the byte buffer
+    output = BytesIO()
+    pacsv.write_csv(_table, output, write_options=pacsv.WriteOptions(include_header=True, batch_size=65536))
+    return output.getvalue()
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _xlsx_bytes(table_name: str, fingerprint: bytes, _table: pa.Table) -> bytes:
+    """XLSX download payload for a loaded table, reused across reruns"""
+    return _excel_bytes(_table)
+
+# Every generated table, the generator that builds it and the tables it consumes, in dependency order
+GENERATION_STEPS = (
+    ("dim_tenants", generate_tenants_data, ()),
+    ("dim_employees", generate_employees_data, ()),
+    ("dim_formulations", generate_formulations_data, ()),
+    ("dim_raw_materials", generate_raw_materials_data, ()),
+    ("dim_customers", generate_customers_data, ()),
+    ("fact_production_batches", generate_production_batches, ("dim_formulations", "dim_employees")),
+    ("dim_inventory_items", generate_inventory_items, ("fact_production_batches", "dim_formulations")),
+    ("fact_inventory_transactions", generate_inventory_transactions,
+     ("dim_inventory_items", "fact_production_batches", "dim_employees", "dim_formulations")),
+    ("fact_sales_transactions", generate_sales_transactions, ("dim_inventory_items", "dim_customers", "dim_employees")),
+    ("fact_ecommerce_orders", generate_ecommerce_orders, ("dim_customers", "fact_sales_transactions")),
+    ("fact_attendance", generate_attendance_data, ("dim_employees",)),
+    ("dim_accounts", generate_financial_accounts, ()),
+    ("fact_financial_transactions", generate_financial_transactions, ("dim_accounts", "fact_sales_transactions")),
+    ("fact_website_traffic", generate_website_traffic, ()),
+    ("fact_production_analytics", generate_production_analytics, ("fact_production_batches",)),
+    ("fact_inventory_analytics", generate_inventory_analytics, ("dim_inventory_items", "fact_inventory_transactions")),
+    ("fact_audit_logs", generate_audit_logs, ("dim_tenants", "dim_employees", "fact_sales_transactions"))
+)
+
+def _run_seeded(fn, seed_seq: np.random.SeedSequence, *args):
+    """Run a generator on this thread with its own Generator seeded from seed_seq"""
+    RNG.generator = np.random.default_rng(seed_seq)
+    return fn(*args)
+
+@st.cache_data(max_entries=4, show_spinner=False)
 def generate_demo_data(seed: int = 42):
-    """Main function to generate all demo data"""
-    # Update random seed
-    np.random.seed(seed)
-    random.seed(seed)
-    
+    """Main function to generate all demo data (memoized per seed across reruns)"""
     try:
         # Generate all datasets with proper error handling
-        print("Step 1/17: Generating tenant data...")
-        tenants_df = generate_tenants_data()
-        
-        print("Step 2/17: Generating employee data...")
-        employees_df = generate_employees_data()
-        
-        print("Step 3/17: Generating product formulations...")
-        formulations_df = generate_formulations_data()
-        
-        print("Step 4/17: Generating raw materials...")
-        raw_materials_df = generate_raw_materials_data()
-        
-        print("Step 5/17: Generating customer data...")
-        customers_df = generate_customers_data()
-        
-        print("Step 6/17: Generating production batches...")
-        batches_df = generate_production_batches(formulations_df, employees_df)
-        
-        print("Step 7/17: Generating inventory items...")
-        inventory_items_df = generate_inventory_items(batches_df, formulations_df)
-        
-        print("Step 8/17: Generating inventory transactions...")
-        inventory_transactions_df = generate_inventory_transactions(
-            inventory_items_df, batches_df, employees_df, formulations_df
-        )
-        
-        print("Step 9/17: Generating sales transactions...")
-        sales_df = generate_sales_transactions(inventory_items_df, customers_df, employees_df)
-        
-        print("Step 10/17: Generating e-commerce orders...")
-        ecommerce_orders_df = generate_ecommerce_orders(customers_df, sales_df)
-        
-        print("Step 11/17: Generating attendance data...")
-        attendance_df = generate_attendance_data(employees_df)
-        
-        print("Step 12/17: Generating financial accounts...")
-        accounts_df = generate_financial_accounts()
-        
-        print("Step 13/17: Generating financial transactions...")
-        financial_transactions_df = generate_financial_transactions(accounts_df, sales_df)
-        
-        print("Step 14/17: Generating website traffic...")
-        website_traffic_df = generate_website_traffic()
-        
-        print("Step 15/17: Generating production analytics...")
-        production_analytics_df = generate_production_analytics(batches_df)
-        
-        print("Step 16/17: Generating inventory analytics...")
-        inventory_analytics_df = generate_inventory_analytics(inventory_items_df, inventory_transactions_df)
+        # Each step starts as soon as the tables it consumes exist, on its own stream spawned from the seed
+        n_steps = len(GENERATION_STEPS)
+        step_seeds = np.random.SeedSequence(seed).spawn(n_steps)
+        waiting = list(zip(GENERATION_STEPS, step_seeds))
+        running = {}
+        datasets = {}
+        with ThreadPoolExecutor(max_workers=min(n_steps, os.cpu_count() or 1)) as pool:
+            while waiting or running:
+                for step in [step for step in waiting if all(dep in datasets for dep in step[0][2])]:
+                    (table_name, fn, deps), step_seed = step
+                    waiting.remove(step)
+                    running[pool.submit(_run_seeded, fn, step_seed, *(datasets[dep] for dep in deps))] = table_name
+                if not running:
+                    # Nothing can start and nothing will finish, so the remaining steps' inputs never appear
+                    blocked = {step[0][0]: [dep for dep in step[0][2] if dep not in datasets] for step in waiting}
+                    raise ValueError(f"Generation steps with unavailable dependencies: {blocked}")
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    table_name = running.pop(future)
+                    datasets[table_name] = future.result()
+                    print(f"Step {len(datasets)}/{n_steps}: Generated {table_name}")
         
-        print("Step 17/17: Generating audit logs...")
-        audit_logs_df = generate_audit_logs(tenants_df, employees_df, sales_df)
-        
-        # Package all data
-        datasets = {
-            "dim_tenants": tenants_df,
-            "dim_employees": employees_df,
-            "dim_formulations": formulations_df,
-            "dim_raw_materials": raw_materials_df,
-            "dim_customers": customers_df,
-            "fact_production_batches": batches_df,
-            "dim_inventory_items": inventory_items_df,
-            "fact_inventory_transactions": inventory_transactions_df,
-            "fact_sales_transactions": sales_df,
-            "fact_ecommerce_orders": ecommerce_orders_df,
-            "fact_attendance": attendance_df,
-            "dim_accounts": accounts_df,
-            "fact_financial_transactions": financial_transactions_df,
-            "fact_website_traffic": website_traffic_df,
-            "fact_production_analytics": production_analytics_df,
-            "fact_inventory_analytics": inventory_analytics_df,
-            "fact_audit_logs": audit_logs_df
-        }
+        # Package all data in schema order
+        datasets = {table_name: datasets[table_name] for table_name, _, _ in GENERATION_STEPS}
         
         # Validate all datasets
         reports = {}
@@ -1374,6 +1652,68 @@ def generate_demo_data(seed: int = 42):
     except Exception as e:
         raise Exception(f"Error generating demo data: {str(e)}")
 
+# Tables summarized by the overview cards, in card order
+OVERVIEW_TABLES = ("fact_production_batches", "dim_inventory_items", "fact_sales_transactions", "dim_customers")
+
+def _overview_metrics(data: dict) -> dict:
+    """Label, value and delta of each overview card whose table is loaded"""
+    # Single Arrow compute reductions over the stored columns, cheap enough to rerun instead of caching
+    metrics = {}
+    if 'fact_production_batches' in data:
+        batches = data['fact_production_batches']
+        avg_yield = pc.mean(batches.column('yield_percentage')).as_py()
+        metrics['fact_production_batches'] = ("Production Batches", f"{batches.num_rows:,}", f"Avg Yield: {avg_yield or 0:.1f}%")
+    if 'dim_inventory_items' in data:
+        inventory = data['dim_inventory_items']
+        total_value = pc.sum(inventory.column('total_value')).as_py() or 0
+        metrics['dim_inventory_items'] = ("Inventory Value", f"KES {total_value:,.0f}", f"{inventory.num_rows} SKUs")
+    if 'fact_sales_transactions' in data:
+        sales = data['fact_sales_transactions']
+        total_sales = pc.sum(sales.column('net_amount')).as_py() or 0
+        metrics['fact_sales_transactions'] = ("Total Sales", f"KES {total_sales:,.0f}", f"{sales.num_rows:,} transactions")
+    if 'dim_customers' in data:
+        customers = data['dim_customers']
+        # One pass over customer_type instead of a filtered copy per type
+        type_counts = {row['values']: row['counts'] for row in pc.value_counts(customers.column('customer_type')).to_pylist()}
+        b2b = type_counts.get('Business', 0)
+        b2c = type_counts.get('Individual', 0)
+        metrics['dim_customers'] = ("Customers", f"{customers.num_rows:,}", f"B2B: {b2b}, B2C: {b2c}")
+    return metrics
+
+# Starting point for the Raw JSON Configuration panel, serialized once per process
+DEFAULT_CONFIG = {
+    "manufacturing": {
+        "default_yield_percentage": 92.5,
+        "target_oee": 85.0,
+        "standard_cycle_time_hours": 24.0,
+        "quality_threshold": 95.0
+    },
+    "inventory": {
+        "holding_cost_percentage": 25.0,
+        "service_level_target": 95.0,
+        "lead_time_days": 14,
+        "safety_stock_multiplier": 1.5
+    },
+    "finance": {
+        "vat_rate": 16.0,
+        "discount_rate": 10.0,
+        "inflation_rate": 6.0,
+        "currency": "KES"
+    },
+    "kenya_specific": {
+        "kra_compliant": True,
+        "kebs_standards": True,
+        "mpesa_integrated": True,
+        "local_suppliers": True
+    }
+}
+_DEFAULT_CONFIG_JSON = json.dumps(DEFAULT_CONFIG, indent=2)
+
+@lru_cache(maxsize=16)
+def _parse_config(text: str) -> dict:
+    """Parse assumptions JSON, reusing the result while the text is unchanged"""
+    return json.loads(text)
+
 # ==================== STREAMLIT APP ====================
 
 def main():
@@ -1382,7 +1722,7 @@ def main():
     
     tab1, tab2, tab3 = st.tabs(["📥 Data Ingestion", "⚙️ Assumptions", "📦 Export & Reset"])
     
-    # Initialize session state for storing data
+    # Initialize session state for storing data (table name -> (Arrow table, content digest))
     if 'generated_data' not in st.session_state:
         st.session_state.generated_data = {}
     
@@ -1409,7 +1749,7 @@ def main():
                         datasets, reports = generate_demo_data(int(seed))
                         
                         # Store in session state
-                        st.session_state.generated_data = datasets
+                        st.session_state.generated_data = {name: _stored_table(name, df) for name, df in datasets.items()}
                         
                         # Update progress
                         progress_bar.progress(100)
@@ -1434,22 +1774,18 @@ def main():
         col1, col2 = st.columns([1, 2], gap="large")
         
         with col1:
-            table_name = st.selectbox("Target table", options=list(SCHEMAS.keys()))
+            table_name = st.selectbox("Target table", options=_SCHEMA_NAMES)
             st.caption("Expected columns:")
-            st.code("\n".join(list(SCHEMAS[table_name]["required"].keys())), language="text")
+            st.code(_SCHEMA_COLUMN_TEXT[table_name], language="text")
         
         with col2:
             uploaded = st.file_uploader("Upload data file", type=["csv", "xlsx", "xls", "parquet"])
             if uploaded is not None:
                 try:
-                    if uploaded.name.lower().endswith(".csv"):
-                        df = pd.read_csv(uploaded)
-                    elif uploaded.name.lower().endswith((".xlsx", ".xls")):
-                        df = pd.read_excel(uploaded)
-                    else:
-                        df = pd.read_parquet(uploaded)
-                    
-                    clean, report = validate_table(table_name, df)
+                    # Reruns with the same file skip the read and validation entirely
+                    raw = uploaded.getvalue()
+                    digest = hashlib.blake2b(raw, digest_size=16).digest()
+                    clean, report = _load_upload(table_name, uploaded.name, digest, raw)
                     
                     st.markdown("### Preview")
                     st.dataframe(clean.head(50), use_container_width=True)
@@ -1471,7 +1807,7 @@ def main():
                     
                     if report["ok"]:
                         if st.button("💾 Save into platform", type="primary"):
-                            st.session_state.generated_data[table_name] = clean
+                            st.session_state.generated_data[table_name] = _stored_table(table_name, clean)
                             st.success(f"Saved {table_name} into session store.")
                     else:
                         st.info("Fix schema errors before saving.")
@@ -1486,9 +1822,10 @@ def main():
         if not st.session_state.generated_data:
             st.info("No tables loaded yet. Generate demo data or upload your extracts above.")
         else:
-            for name, df in st.session_state.generated_data.items():
-                with st.expander(f"{name} — {len(df):,} rows"):
-                    st.dataframe(df.head(200), use_container_width=True)
+            # Arrow slices are zero-copy views, so each preview costs only its first 200 rows
+            for name, (table, _) in st.session_state.generated_data.items():
+                with st.expander(f"{name} — {table.num_rows:,} rows"):
+                    st.dataframe(table.slice(0, 200), use_container_width=True)
     
     with tab2:
         st.subheader("Scenario & Model Assumptions (JSON)")
@@ -1537,38 +1874,11 @@ def main():
         
         with right:
             st.markdown("**Raw JSON Configuration** (advanced)")
-            default_config = {
-                "manufacturing": {
-                    "default_yield_percentage": 92.5,
-                    "target_oee": 85.0,
-                    "standard_cycle_time_hours": 24.0,
-                    "quality_threshold": 95.0
-                },
-                "inventory": {
-                    "holding_cost_percentage": 25.0,
-                    "service_level_target": 95.0,
-                    "lead_time_days": 14,
-                    "safety_stock_multiplier": 1.5
-                },
-                "finance": {
-                    "vat_rate": 16.0,
-                    "discount_rate": 10.0,
-                    "inflation_rate": 6.0,
-                    "currency": "KES"
-                },
-                "kenya_specific": {
-                    "kra_compliant": True,
-                    "kebs_standards": True,
-                    "mpesa_integrated": True,
-                    "local_suppliers": True
-                }
-            }
-            
-            text = st.text_area("Assumptions JSON", value=json.dumps(default_config, indent=2), height=300)
+            text = st.text_area("Assumptions JSON", value=_DEFAULT_CONFIG_JSON, height=300)
             
             if st.button("Load JSON Configuration", use_container_width=True):
                 try:
-                    config = json.loads(text)
+                    config = _parse_config(text)
                     st.success("Configuration loaded successfully!")
                     st.json(config)
                 except Exception as e:
@@ -1580,11 +1890,11 @@ def main():
         
         if st.session_state.generated_data:
             export_name = st.selectbox("Select table to export", options=list(st.session_state.generated_data.keys()))
-            df = st.session_state.generated_data[export_name]
+            table, fingerprint = st.session_state.generated_data[export_name]
             
             col1, col2 = st.columns(2)
             with col1:
-                csv = df.to_csv(index=False).encode("utf-8")
+                csv = _csv_bytes(export_name, fingerprint, table)
                 st.download_button(
                     "📥 Download selected table (CSV)",
                     data=csv,
@@ -1595,11 +1905,7 @@ def main():
             
             with col2:
                 # Convert to Excel
-                output = BytesIO()
-                with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-                    df.to_excel(writer, index=False, sheet_name='Data')
-                
-                excel_data = output.getvalue()
+                excel_data = _xlsx_bytes(export_name, fingerprint, table)
                 
                 st.download_button(
                     "📊 Download as Excel",
@@ -1609,7 +1915,7 @@ def main():
                     use_container_width=True
                 )
             
-            st.caption(f"Table '{export_name}' has {len(df):,} rows and {len(df.columns)} columns.")
+            st.caption(f"Table '{export_name}' has {table.num_rows:,} rows and {table.num_columns} columns.")
         else:
             st.info("No tables loaded to export.")
         
@@ -1633,35 +1939,12 @@ def main():
     
     if st.session_state.generated_data:
         # Create summary cards
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            if 'fact_production_batches' in st.session_state.generated_data:
-                batches = st.session_state.generated_data['fact_production_batches']
-                total_batches = len(batches)
-                avg_yield = batches['yield_percentage'].mean()
-                st.metric("Production Batches", f"{total_batches:,}", f"Avg Yield: {avg_yield:.1f}%")
-        
-        with col2:
-            if 'dim_inventory_items' in st.session_state.generated_data:
-                inventory = st.session_state.generated_data['dim_inventory_items']
-                total_value = inventory['total_value'].sum()
-                total_items = len(inventory)
-                st.metric("Inventory Value", f"KES {total_value:,.0f}", f"{total_items} SKUs")
-        
-        with col3:
-            if 'fact_sales_transactions' in st.session_state.generated_data:
-                sales = st.session_state.generated_data['fact_sales_transactions']
-                total_sales = sales['net_amount'].sum()
-                total_transactions = len(sales)
-                st.metric("Total Sales", f"KES {total_sales:,.0f}", f"{total_transactions:,} transactions")
+        metrics = _overview_metrics({name: table for name, (table, _) in st.session_state.generated_data.items()})
         
-        with col4:
-            if 'dim_customers' in st.session_state.generated_data:
-                customers = st.session_state.generated_data['dim_customers']
-                b2b = len(customers[customers['customer_type'] == 'Business'])
-                b2c = len(customers[customers['customer_type'] == 'Individual'])
-                st.metric("Customers", f"{len(customers):,}", f"B2B: {b2b}, B2C: {b2c}")
+        for column, name in zip(st.columns(4), OVERVIEW_TABLES):
+            if name in metrics:
+                with column:
+                    st.metric(*metrics[name])
 
 if __name__ == "__main__":
     main()
\ No newline at end of file